@@ -2,9 +2,11 @@
 
 import subprocess
 import logging
+import hashlib
+import os
 from pathlib import Path
-import tempfile
-from typing import Optional, List
+from functools import lru_cache
+from typing import Optional, List, Tuple
 import shutil
 import time
 
@@ -15,8 +17,11 @@ class ThumbnailGenerator:
     """Generate video thumbnails using FFmpeg."""
 
     THUMBNAIL_SIZE = "160x90"  # Width x Height
+    TIMELINE_FRAME_SIZE = (120, 67)  # Width, Height of timeline frames
     THUMBNAIL_QUALITY = 3  # 1-10, lower = better quality
     CACHE_DIR = None
+    CACHE_KEY_BYTES = 64 * 1024  # Leading bytes hashed into the cache key
+    CACHE_MAX_BYTES = 512 * 1024 * 1024  # Size trim_cache shrinks the cache to
     FFMPEG_PATH = None
     FFPROBE_PATH = None
 
@@ -99,11 +104,43 @@ class ThumbnailGenerator:
     def _get_cache_dir() -> Path:
         """Get or create thumbnail cache directory."""
         if ThumbnailGenerator.CACHE_DIR is None:
-            cache_dir = Path(tempfile.gettempdir()) / "videomanager_thumbs"
-            cache_dir.mkdir(exist_ok=True)
+            cache_dir = Path.home() / ".cache" / "videomanager" / "thumbs"
+            cache_dir.mkdir(parents=True, exist_ok=True)
             ThumbnailGenerator.CACHE_DIR = cache_dir
         return ThumbnailGenerator.CACHE_DIR
 
+    @staticmethod
+    def _cache_key(video_path: str) -> str:
+        """
+        Get the cache file stem for a video.
+        
+        The key hashes the file size, modification time and leading bytes,
+        so renamed or moved videos keep their cached thumbnails while
+        edited videos, or different videos sharing a file name, get their own.
+        
+        Args:
+            video_path: Path to video file
+            
+        Returns:
+            Hex digest key, or the file stem if the video cannot be read
+        """
+        try:
+            stat = os.stat(video_path)
+            return ThumbnailGenerator._content_key(
+                video_path, stat.st_size, int(stat.st_mtime)
+            )
+        except OSError:
+            return Path(video_path).stem
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _content_key(video_path: str, size: int, mtime: int) -> str:
+        """Hash size, mtime and leading bytes (memoized per path and stat)."""
+        digest = hashlib.sha1(f"{size}:{mtime}:".encode())
+        with open(video_path, 'rb') as f:
+            digest.update(f.read(ThumbnailGenerator.CACHE_KEY_BYTES))
+        return digest.hexdigest()
+
     @staticmethod
     def get_video_duration(video_path: str) -> Optional[float]:
         """
@@ -233,7 +270,7 @@ class ThumbnailGenerator:
                     '-i', video_path,
                     '-ss', str(timestamp),
                     '-vframes', '1',
-                    '-vf', 'scale=120:67',
+                    '-vf', 'scale={}:{}'.format(*ThumbnailGenerator.TIMELINE_FRAME_SIZE),
                     '-q:v', '5',
                     '-y',
                     frame_path
@@ -312,12 +349,15 @@ class ThumbnailGenerator:
         # Generate output path if not provided
         if output_path is None:
             cache_dir = ThumbnailGenerator._get_cache_dir()
-            safe_name = Path(video_path).stem
+            safe_name = ThumbnailGenerator._cache_key(video_path)
             output_path = str(cache_dir / f"{safe_name}_thumb.jpg")
 
-        # Skip if already generated
-        if Path(output_path).exists():
+        # Skip if already generated; touching it keeps it last in trim_cache's order
+        try:
+            os.utime(output_path)
             return output_path
+        except FileNotFoundError:
+            pass
 
         # Get timestamp if not provided
         if timestamp is None:
@@ -364,14 +404,71 @@ class ThumbnailGenerator:
 
     @staticmethod
     def cleanup_cache():
-        """Remove cached thumbnails."""
+        """Remove cached thumbnails and timeline frames."""
+        ThumbnailGenerator.trim_cache(0)
+        logger.info("Cleaned up thumbnail cache")
+
+    @staticmethod
+    def trim_cache(max_bytes: Optional[int] = None) -> int:
+        """Delete the oldest cache entries until the cache fits in max_bytes.
+        
+        An entry is a thumbnail file or a video's timeline frame directory, and is
+        dated by its newest modification time. Reused thumbnails are touched, so
+        thumbnails still being shown are kept longest.
+        
+        Args:
+            max_bytes: Size limit (CACHE_MAX_BYTES if None)
+            
+        Returns:
+            Number of bytes freed
+        """
+        limit = ThumbnailGenerator.CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        entries = []  # (mtime, size, path, is_dir)
+        total = 0
         try:
-            cache_dir = ThumbnailGenerator._get_cache_dir()
-            for thumb_file in cache_dir.glob("*.jpg"):
-                thumb_file.unlink()
-            logger.info("Cleaned up thumbnail cache")
+            with os.scandir(ThumbnailGenerator._get_cache_dir()) as it:
+                for entry in it:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if is_dir:
+                        size, mtime = ThumbnailGenerator._dir_usage(entry.path)
+                    else:
+                        stat = entry.stat(follow_symlinks=False)
+                        size, mtime = stat.st_size, stat.st_mtime
+                    entries.append((mtime, size, entry.path, is_dir))
+                    total += size
         except OSError as e:
-            logger.warning("Error cleaning up cache: %s", e)
+            logger.warning("Error scanning thumbnail cache: %s", e)
+            return 0
+
+        freed = 0
+        for _, size, path, is_dir in sorted(entries):
+            if total - freed <= limit:
+                break
+            try:
+                if is_dir:
+                    shutil.rmtree(path)
+                else:
+                    os.remove(path)
+            except OSError as e:
+                logger.warning("Error removing cached %s: %s", path, e)
+                continue
+            freed += size
+        if freed:
+            logger.info("Trimmed thumbnail cache by %d bytes", freed)
+        return freed
+
+    @staticmethod
+    def _dir_usage(path: str) -> Tuple[int, float]:
+        """Total file size and newest modification time of a cache directory."""
+        size = 0
+        mtime = os.stat(path).st_mtime
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    stat = entry.stat(follow_symlinks=False)
+                    size += stat.st_size
+                    mtime = max(mtime, stat.st_mtime)
+        return size, mtime
 
     @staticmethod
     def generate_single_timeline_frame(
@@ -403,12 +500,12 @@ class ThumbnailGenerator:
         # Generate output directory if not provided
         if output_dir is None:
             cache_dir = ThumbnailGenerator._get_cache_dir()
-            safe_name = Path(video_path).stem
+            safe_name = ThumbnailGenerator._cache_key(video_path)
             output_dir = str(cache_dir / f"{safe_name}_timeline")
             Path(output_dir).mkdir(exist_ok=True)
 
-        # Generate frame filename
-        frame_filename = f"frame_{frame_index:02d}.jpg"
+        # Same PNG name _extract_frame_with_retry writes, so existing frames are reused
+        frame_filename = f"frame_{frame_index}_{int(timestamp)}.png"
         frame_path = str(Path(output_dir) / frame_filename)
 
         # Skip if already exists
@@ -466,7 +563,7 @@ class ThumbnailGenerator:
         # Generate output directory if not provided
         if output_dir is None:
             cache_dir = ThumbnailGenerator._get_cache_dir()
-            safe_name = Path(video_path).stem
+            safe_name = ThumbnailGenerator._cache_key(video_path)
             output_dir = str(cache_dir / f"{safe_name}_timeline")
             Path(output_dir).mkdir(exist_ok=True)
 
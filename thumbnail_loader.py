@@ -1,6 +1,6 @@
 """Asynchronous thumbnail loading for VideoManager.
 
-Handles loading and caching of thumbnail images in a separate thread
+Handles generating and decoding thumbnail images in worker threads
 to prevent UI blocking when loading large numbers of videos.
 """
 
@@ -9,7 +9,7 @@ import logging
 import threading
 import queue
 from pathlib import Path
-from typing import Dict, Optional, Callable
+from typing import Dict, Optional, Callable, List
 from PIL import Image, ImageTk
 from thumbnail_generator import ThumbnailGenerator
 
@@ -24,16 +24,19 @@ class ThumbnailLoader:
     THUMB_HEIGHT = 82
     PLACEHOLDER_COLOR = '#404040'
 
-    def __init__(self, max_workers: int = 3):
+    def __init__(self, max_workers: int = 3, max_ffmpeg: Optional[int] = None):
         """Initialize thumbnail loader.
         
         Args:
             max_workers: Number of worker threads for parallel loading
+            max_ffmpeg: Maximum concurrent thumbnail generations (FFmpeg processes);
+                defaults to max_workers
         """
         self.max_workers = max_workers
+        # Each FFmpeg process can take 100MB+, so generation may be capped below max_workers
+        self._ffmpeg_slots = threading.BoundedSemaphore(max_ffmpeg or max_workers)
         self.worker_threads: Dict[int, threading.Thread] = {}
         self.request_queue: queue.Queue = queue.Queue()
-        self.thumbnail_cache: Dict[str, ImageTk.PhotoImage] = {}
         self.loading_set: set = set()  # Track videos currently loading
         self.is_running = True
         self.stop_event = threading.Event()
@@ -74,32 +77,29 @@ class ThumbnailLoader:
                     self.loading_set.add(video_path)
                     
                     # Generate thumbnail
-                    thumb_path = ThumbnailGenerator.generate_thumbnail(video_path)
+                    with self._ffmpeg_slots:
+                        thumb_path = ThumbnailGenerator.generate_thumbnail(video_path)
                     
                     if thumb_path and Path(thumb_path).exists():
-                        # Load image
-                        img = Image.open(thumb_path)
-                        # Resize to ensure consistent size
-                        img = img.resize((self.THUMB_WIDTH, self.THUMB_HEIGHT), Image.Resampling.LANCZOS)
-                        photo = ImageTk.PhotoImage(img)
-                        
-                        # Cache the PhotoImage
-                        self.thumbnail_cache[video_path] = photo
+                        # Decode and resize here; the PhotoImage is made on the UI thread
+                        with Image.open(thumb_path) as img:
+                            image = img.resize((self.THUMB_WIDTH, self.THUMB_HEIGHT),
+                                               Image.Resampling.LANCZOS)
                         
                         logger.debug('Loaded thumbnail for: %s', Path(video_path).name)
                     else:
                         logger.warning('Failed to generate thumbnail for: %s', video_path)
-                        photo = None
+                        image = None
                     
                 except (OSError, ValueError, IOError) as e:
                     logger.error('Error loading thumbnail for %s: %s', video_path, e)
-                    photo = None
+                    image = None
                 
                 finally:
                     self.loading_set.discard(video_path)
                     # Call the callback with the result
                     try:
-                        callback(video_path, photo)
+                        callback(video_path, image)
                     except (RuntimeError, tk.TclError) as e:
                         logger.error('Error in thumbnail callback: %s', e)
                     
@@ -110,18 +110,15 @@ class ThumbnailLoader:
             except (RuntimeError, ValueError) as e:
                 logger.error('Worker thread error: %s', e)
 
-    def queue_thumbnail(self, video_path: str, callback: Callable[[str, Optional[ImageTk.PhotoImage]], None]):
+    def queue_thumbnail(self, video_path: str, callback: Callable[[str, Optional[Image.Image]], None]):
         """Queue a thumbnail for loading.
         
         Args:
             video_path: Path to video file
-            callback: Function to call when thumbnail is ready. Receives (video_path, photo)
+            callback: Called from a worker thread when the thumbnail is ready.
+                Receives (video_path, image), where image is a decoded PIL image
+                or None if it could not be generated
         """
-        # Check cache first
-        if video_path in self.thumbnail_cache:
-            callback(video_path, self.thumbnail_cache[video_path])
-            return
-        
         # Skip if already loading
         if video_path in self.loading_set:
             return
@@ -129,6 +126,31 @@ class ThumbnailLoader:
         # Queue for loading
         self.request_queue.put((video_path, callback))
 
+    def cancel_pending(self) -> List[str]:
+        """Drop queued requests that no worker has picked up yet.
+        
+        Returns:
+            Video paths whose requests were cancelled (their callbacks won't fire)
+        """
+        cancelled = []
+        if not self.is_running:
+            return cancelled  # Keep shutdown sentinels in the queue
+        while True:
+            try:
+                request = self.request_queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is None:
+                # Shutdown raced us - put the sentinel back and stop draining
+                self.request_queue.task_done()
+                self.request_queue.put(None)
+                break
+            cancelled.append(request[0])
+            self.request_queue.task_done()
+        if cancelled:
+            logger.debug('Cancelled %d pending thumbnail requests', len(cancelled))
+        return cancelled
+
     def get_placeholder_image(self) -> tk.PhotoImage:
         """Get a placeholder image when thumbnail is loading or unavailable.
         
@@ -140,11 +162,6 @@ class ThumbnailLoader:
                        color=self.PLACEHOLDER_COLOR)
         return ImageTk.PhotoImage(img)
 
-    def clear_cache(self):
-        """Clear the thumbnail cache to free memory."""
-        self.thumbnail_cache.clear()
-        logger.info('Thumbnail cache cleared')
-
     def shutdown(self):
         """Shutdown the thumbnail loader and cleanup."""
         logger.info('Shutting down thumbnail loader')
@@ -159,9 +176,6 @@ class ThumbnailLoader:
         for thread in self.worker_threads.values():
             thread.join(timeout=2.0)
         
-        # Clear cache
-        self.clear_cache()
-        
         logger.info('Thumbnail loader shut down')
 
     def get_queue_size(self) -> int:
@@ -3,12 +3,19 @@
 import tkinter as tk
 from tkinter import ttk
 import logging
-from typing import List, Dict, Any, Callable
+import json
+import os
+from typing import List, Dict, Any, Callable, Tuple, Optional, Set
 from pathlib import Path
+import bisect
 import threading
+import queue
+from collections import OrderedDict, defaultdict
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
 from PIL import Image, ImageTk
 from thumbnail_generator import ThumbnailGenerator
 from thumbnail_loader import ThumbnailLoader
+from ui_utils import weak_cmd
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +32,74 @@ class UIPreview:
     # Optimized breakpoints to show 5 columns on standard window size
     # Width thresholds and corresponding column counts
     GRID_COLS = {400: 2, 600: 3, 800: 5, 1200: 6, 1600: 7}
+    GRID_COLS_SORTED = sorted(GRID_COLS.items())
+    GRID_COLS_THRESHOLDS = [threshold for threshold, _ in GRID_COLS_SORTED]
+
+    # Grid tile geometry: thumbnail (145x82) + padding + border, plus spacing
+    GRID_TILE_WIDTH = 160
+    GRID_TILE_HEIGHT = 145
+    GRID_TILE_PAD = 5
+    GRID_CELL_WIDTH = GRID_TILE_WIDTH + 2 * GRID_TILE_PAD
+    GRID_ROW_HEIGHT = GRID_TILE_HEIGHT + 2 * GRID_TILE_PAD
+
+    # Extra rows placed above and below the viewport so fast scrolling doesn't show gaps
+    GRID_OVERSCAN_ROWS = 1
+
+    # Wheel ticks arriving within this many ms are applied as one scroll
+    GRID_WHEEL_FLUSH_MS = 8
+
+    # Delay (ms) after the last resize event before the grid is relaid out
+    GRID_RESIZE_DEBOUNCE_MS = 150
+
+    # List view columns: (column id, heading, width)
+    LIST_COLUMNS = (
+        ('ext', 'Ext', 60),
+        ('title', 'Title', 300),
+        ('duration', 'Duration', 90),
+        ('category', 'Category', 90),
+        ('rating', 'Rating', 90),
+        ('notes', 'Notes', 300),
+    )
+
+    # Rating star strings, indexed by rating 0-5
+    _RATING_STARS = tuple('★' * i + '☆' * (5 - i) for i in range(6))
+
+    # Thumbnail loader threads (scaled to the CPU) and cap on concurrent FFmpeg processes
+    THUMBNAIL_WORKERS = min(os.cpu_count() or 4, 8)
+    THUMBNAIL_MAX_FFMPEG = 4
+
+    # Interval (ms) at which decoded thumbnails are installed in the grid, in batches
+    THUMBNAIL_POLL_MS = 50
+
+    # Maximum number of decoded PhotoImages kept in the LRU photo cache
+    PHOTO_CACHE_SIZE = 500
+
+    # Number of videos whose decoded timeline frames are kept for reselection
+    TIMELINE_PHOTO_CACHE_SIZE = 16
+
+    # Number of timeline frames per row
+    TIMELINE_COLS_PER_ROW = 7
+
+    # Concurrent FFmpeg frame extractions per timeline
+    TIMELINE_WORKERS = 4
+
+    # Size of extracted timeline frames (width, height)
+    TIMELINE_FRAME_SIZE = ThumbnailGenerator.TIMELINE_FRAME_SIZE
+
+    # Timeline cell geometry on the canvas: frame + border + spacing, timestamp below
+    TIMELINE_CELL_WIDTH = TIMELINE_FRAME_SIZE[0] + 8
+    TIMELINE_CELL_HEIGHT = TIMELINE_FRAME_SIZE[1] + 30
+
+    # Timeline cache persisted across restarts, and delay (s) to coalesce writes
+    TIMELINE_CACHE_FILE = Path.home() / '.videomanager' / 'timeline_cache.json'
+    TIMELINE_CACHE_FLUSH_DELAY = 2.0
+
+    # Persisted timelines kept; the least recently used are dropped first
+    TIMELINE_CACHE_MAX_ENTRIES = 500
+
+    # Timeline updates are batched: poll interval (ms) and max updates per poll
+    TIMELINE_POLL_MS = 50
+    TIMELINE_DRAIN_LIMIT = 20
 
     # Category color mapping (RGB hex colors for visual distinction)
     CATEGORY_COLORS = {
@@ -40,23 +115,77 @@ class UIPreview:
     def __init__(self, parent: ttk.Frame, on_selection_callback: Callable[[int, Dict], None]):
         self.parent = parent
         self.on_selection_callback = on_selection_callback
+        self._video_by_id: Dict[int, Dict[str, Any]] = {}
         self.video_data = []
         self.selected_video_id = None
+
+        # Whether each video path exists, checked the first time a tile or timeline
+        # needs it and forgotten by load_videos
+        self._path_exists: Dict[str, bool] = {}
         self.last_grid_width = 0  # For tracking grid resize
+        self._last_grid_signature = None  # (cols, count, ids hash) of the current layout
+
+        # Single-lookup category tables; unknown categories fall back to 'other'
+        self._cat_color = defaultdict(lambda: self.CATEGORY_COLORS['other'], self.CATEGORY_COLORS)
+        self._cat_tag = defaultdict(lambda: 'other', {c: c for c in self.CATEGORY_COLORS})
+        self._resize_after_id = None  # Pending debounced grid resize
+        self._after_ids: Set[str] = set()  # Pending after() callbacks, cancelled on cleanup
 
         # Threading for timeline generation
         self.timeline_generation_thread = None
+        # Stop event of the current generation; each generation gets its own
         self.timeline_stop_event = threading.Event()
 
-        # Cache for generated timeline frames (persists during app lifetime)
-        # Structure: {video_id: {'frames': [frame_paths], 'duration': duration_sec}}
-        self.timeline_cache = {}
+        # Shared pool that runs the FFmpeg frame extractions of a timeline in
+        # parallel; reused across selections
+        self._timeline_pool = ThreadPoolExecutor(max_workers=self.TIMELINE_WORKERS,
+                                                 thread_name_prefix='TimelineFrame')
+        self._timeline_futures = []
 
-        # Initialize asynchronous thumbnail loader (3 worker threads)
-        self.thumbnail_loader = ThumbnailLoader(max_workers=3)
+        # Worker -> UI updates are queued and applied in batches by one poller.
+        # Items are (generation, callback, args); stale generations are dropped.
+        self._timeline_queue: queue.Queue = queue.Queue()
+        self._timeline_poll_id = None
+        self._timeline_gen = 0
 
-        # Store references to thumbnail labels for updating
-        self.thumbnail_labels: Dict[str, tk.Label] = {}  # {video_path: tk.Label}
+        # Timelines shown this session, by video id
+        # Structure: {video_id: {'frames': [frame_paths], 'duration': duration_sec}}
+        self.timeline_cache: Dict[int, Dict[str, Any]] = {}
+
+        # Timelines persisted to TIMELINE_CACHE_FILE, keyed by video path and content
+        # key (see _timeline_store_key), least recently used first. Frames are only
+        # checked on a worker when an entry is used
+        self._cache_file = self.TIMELINE_CACHE_FILE
+        self._cache_flush_timer = None
+        self._cache_flush_lock = threading.Lock()
+        self._timeline_store_lock = threading.Lock()
+        self._timeline_store = self._load_timeline_cache()
+        # Keep the on-disk thumbnail and frame cache bounded, off the Tk thread
+        self._timeline_pool.submit(ThumbnailGenerator.trim_cache)
+
+        # Initialize asynchronous thumbnail loader
+        self.thumbnail_loader = ThumbnailLoader(max_workers=self.THUMBNAIL_WORKERS,
+                                                max_ffmpeg=self.THUMBNAIL_MAX_FFMPEG)
+
+        # Decoded (video_path, PIL image or None) from the loader's workers; the
+        # UI thread turns them into PhotoImages in batches
+        self._thumbnail_queue: queue.Queue = queue.Queue()
+        self._thumbnail_poll_id = None
+
+        # Store references to the grid tiles showing each thumbnail for updating
+        self.thumbnail_tiles: Dict[str, Tuple[int, int, int, int]] = {}  # {video_path: tile}
+        # Reverse of thumbnail_tiles, so releasing a tile doesn't scan every entry
+        self._tile_paths: Dict[Tuple[int, int, int, int], str] = {}
+
+        # Decoded grid thumbnails keyed by video_path, so rebuilds skip the disk read and decode
+        self._photo_cache: 'OrderedDict[str, ImageTk.PhotoImage]' = OrderedDict()
+
+        # Decoded timeline frames of recently viewed videos, so reselection skips the decode
+        # Structure: {video_id: {frame_index: (photo, timestamp_str)}}
+        self._timeline_photo_cache: 'OrderedDict[int, Dict[int, Tuple[Any, str]]]' = OrderedDict()
+
+        # Video paths queued on the thumbnail loader whose callback hasn't arrived yet
+        self._in_flight: set[str] = set()
 
         # Create notebook with tabs
         self.notebook = ttk.Notebook(self.parent)
@@ -84,26 +213,43 @@ class UIPreview:
 
         self.grid_canvas = tk.Canvas(self.grid_frame, bg='white', highlightthickness=0)
         scrollbar = ttk.Scrollbar(self.grid_frame, orient=tk.VERTICAL,
-                                  command=self.grid_canvas.yview)
+                                  command=weak_cmd(self, UIPreview._on_grid_scroll))
 
         self.grid_canvas.configure(yscrollcommand=scrollbar.set)
         self.grid_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self.grid_scrollable = ttk.Frame(self.grid_canvas)
-        self.grid_canvas.create_window((0, 0), window=self.grid_scrollable, anchor=tk.NW)
+        # Only the rows inside the viewport get tiles; tiles that scroll out of
+        # view go back to the pool and are reconfigured for the next video.
+        # Each tile is a set of canvas items: (rect_id, image_id, status_id, title_id).
+        self._grid_widget_pool: List[Tuple[int, int, int, int]] = []
+        self._grid_placed: Dict[int, Tuple[int, int, int, int]] = {}
+        self._grid_visible = None  # Index range currently placed, or None after a reset
+        self._grid_images: Dict[int, Any] = {}  # {image_id: PhotoImage} keeps refs alive
+        self._grid_cols = 1
+        self._grid_placeholder = None
+
+        # Accumulated wheel scroll (units) waiting for the next flush
+        self._wheel_accum = 0
+        self._wheel_pending = None
+
+        # Single click handler for every tile, resolved through the item tags
+        self.grid_canvas.tag_bind('vid', '<Button-1>', weak_cmd(self, UIPreview._on_canvas_click))
 
         # Bind mousewheel to canvas and make canvas focusable
-        self.grid_canvas.bind('<MouseWheel>', self._on_mousewheel_grid)
-        self.grid_canvas.bind('<Button-4>', self._on_mousewheel_grid)
-        self.grid_canvas.bind('<Button-5>', self._on_mousewheel_grid)
+        on_wheel = weak_cmd(self, UIPreview._on_mousewheel_grid)
+        self.grid_canvas.bind('<MouseWheel>', on_wheel)
+        self.grid_canvas.bind('<Button-4>', on_wheel)
+        self.grid_canvas.bind('<Button-5>', on_wheel)
         
         # Make canvas focusable and bind mousewheel on focus
-        self.grid_canvas.bind('<Enter>', lambda e: self.grid_canvas.focus_set())
-        self.grid_frame.bind('<Enter>', lambda e: self.grid_canvas.focus_set())
+        self.grid_canvas.bind('<Enter>', lambda e, canvas=self.grid_canvas: canvas.focus_set())
+        self.grid_frame.bind('<Enter>', lambda e, canvas=self.grid_canvas: canvas.focus_set())
 
         # Bind resize event for dynamic grid recalculation
-        self.grid_frame.bind('<Configure>', self._on_grid_frame_resize)
+        self.grid_frame.bind('<Configure>', weak_cmd(self, UIPreview._on_grid_frame_resize))
+        # Viewport height changes expose or hide rows
+        self.grid_canvas.bind('<Configure>', weak_cmd(self, UIPreview._recycle_grid))
 
     def _build_legend_frame(self, parent_frame: ttk.Frame):
         """Build category legend frame.
@@ -142,9 +288,43 @@ class UIPreview:
             )
             cat_label.pack(side=tk.LEFT, padx=2, pady=5)
 
+    def _after(self, ms: int, callback: Callable, *args) -> str:
+        """Schedule a callback with after() and track its id until it runs.
+        
+        Args:
+            ms: Delay in milliseconds
+            callback: Function to call on the UI thread
+            *args: Arguments for the callback
+            
+        Returns:
+            The after() id
+        """
+        def run():
+            self._after_ids.discard(after_id)
+            callback(*args)
+        after_id = self.parent.after(ms, run)
+        self._after_ids.add(after_id)
+        return after_id
+
+    def _after_cancel(self, after_id: str):
+        """Cancel a callback scheduled with _after()."""
+        self._after_ids.discard(after_id)
+        try:
+            self.parent.after_cancel(after_id)
+        except tk.TclError:
+            pass
+
     def _on_grid_frame_resize(self, event):
-        """Handle grid frame resize events to recalculate columns."""
-        current_width = event.width
+        """Handle grid frame resize events, debounced so a drag relays out once."""
+        if self._resize_after_id:
+            self._after_cancel(self._resize_after_id)
+        self._resize_after_id = self._after(
+            self.GRID_RESIZE_DEBOUNCE_MS, self._do_resize, event.width
+        )
+
+    def _do_resize(self, current_width: int):
+        """Recalculate grid columns for the final width of a resize."""
+        self._resize_after_id = None
 
         # Only recalculate if width changed significantly (> 50px)
         if abs(current_width - self.last_grid_width) > 50:
@@ -152,39 +332,35 @@ class UIPreview:
             # Recalculate and redraw grid
             self._update_grid_view()
 
-            # Update scrollregion for canvas
-            self.grid_scrollable.update_idletasks()
-            self.grid_canvas.configure(scrollregion=self.grid_canvas.bbox('all'))
-
     def _build_list_view(self):
-        """Build the list view with custom scrollable layout."""
+        """Build the list view as a single Treeview."""
         # Add legend frame at the top
         self._build_legend_frame(self.list_frame)
-        
-        # Create canvas with scrollbar for list view
-        self.list_canvas = tk.Canvas(self.list_frame, bg='white', highlightthickness=0)
+
+        # One Treeview holds every row; Tk only draws the visible items
+        columns = tuple(col for col, _heading, _width in self.LIST_COLUMNS)
+        self.list_tree = ttk.Treeview(self.list_frame, columns=columns, show='headings',
+                                      selectmode='browse')
+        for col, heading, width in self.LIST_COLUMNS:
+            self.list_tree.heading(col, text=heading, anchor=tk.W)
+            self.list_tree.column(col, width=width, anchor=tk.W,
+                                  stretch=col in ('title', 'notes'))
+
         scrollbar = ttk.Scrollbar(self.list_frame, orient=tk.VERTICAL,
-                                  command=self.list_canvas.yview)
-        
-        self.list_canvas.configure(yscrollcommand=scrollbar.set)
-        self.list_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+                                  command=self.list_tree.yview)
+        self.list_tree.configure(yscrollcommand=scrollbar.set)
+        self.list_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self.list_scrollable = ttk.Frame(self.list_canvas)
-        self.list_canvas.create_window((0, 0), window=self.list_scrollable, anchor=tk.NW)
+        # Row background per category, applied through item tags
+        for category, color in self.CATEGORY_COLORS.items():
+            self.list_tree.tag_configure(category, background=color)
 
-        # Bind mousewheel to canvas and make canvas focusable
-        self.list_canvas.bind('<MouseWheel>', self._on_mousewheel_list)
-        self.list_canvas.bind('<Button-4>', self._on_mousewheel_list)
-        self.list_canvas.bind('<Button-5>', self._on_mousewheel_list)
-        
-        # Make canvas focusable and bind mousewheel on focus
-        self.list_canvas.bind('<Enter>', lambda e: self.list_canvas.focus_set())
-        self.list_frame.bind('<Enter>', lambda e: self.list_canvas.focus_set())
+        # One selection handler serves every row
+        self.list_tree.bind('<<TreeviewSelect>>', weak_cmd(self, UIPreview._on_list_select))
 
-        # Update scrollregion
-        self.list_scrollable.bind('<Configure>', 
-            lambda e: self.list_canvas.configure(scrollregion=self.list_canvas.bbox('all')))
+        # Shown over the empty tree by _update_list_empty_state
+        self._list_empty_label = ttk.Label(self.list_tree, text='No videos loaded')
 
     def _build_timeline_view(self):
         """Build the timeline view for frame thumbnails."""
@@ -216,38 +392,176 @@ class UIPreview:
         self.timeline_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Frame for timeline images (with wrapping layout)
-        self.timeline_scroll_frame = tk.Frame(self.timeline_canvas, bg='#f0f0f0')
-        self.timeline_canvas.create_window((0, 0), window=self.timeline_scroll_frame, anchor='nw')
-
-        # Bind configure event to update scroll region
-        self.timeline_scroll_frame.bind('<Configure>', self._on_timeline_frame_configure)
-
         # Dictionary to store PhotoImage references
         self.timeline_photos = {}
 
-    def _on_timeline_frame_configure(self, _event):
-        """Update canvas scroll region when timeline frame changes size."""
-        self.timeline_canvas.configure(scrollregion=self.timeline_canvas.bbox('all'))
+        # Frames are drawn as canvas items, not widgets.
+        # Reusable (border, image, timestamp) item ids, grown lazily
+        self._timeline_items: List[Tuple[int, int, int]] = []
+
+    def _update_timeline_scrollregion(self):
+        """Fit the timeline scroll region to the frames currently shown."""
+        # Hidden items don't count towards bbox; nothing shown gives None
+        self.timeline_canvas.configure(
+            scrollregion=self.timeline_canvas.bbox('all') or (0, 0, 0, 0)
+        )
+
+    @property
+    def video_data(self) -> List[Dict[str, Any]]:
+        """Videos shown in all views."""
+        return self._video_data
+
+    @video_data.setter
+    def video_data(self, video_data: List[Dict[str, Any]]):
+        """Replace the shown videos and rebuild the id lookup."""
+        self._video_data = video_data
+        self._video_by_id = {v['id']: v for v in video_data}
 
     def load_videos(self, video_data: List[Dict[str, Any]]):
         """Load videos into all views."""
         self.video_data = video_data
+        self._path_exists = {}
+        # Tile contents may have changed even if the ids haven't
+        self._last_grid_signature = None
         # Defer grid update to ensure geometry is calculated
-        self.parent.after(100, self._update_grid_view)
+        self._after(100, self._update_grid_view)
         self._update_list_view()
 
+    def append_video(self, video: Dict[str, Any]):
+        """Show one newly added video without reloading every view.
+        
+        The video goes first, matching the newest-first order of a full load.
+        
+        Args:
+            video: Video metadata dict as returned by the database
+        """
+        self._video_data.insert(0, video)
+        self._video_by_id[video['id']] = video
+        values, tags = self._list_row(video)
+        self.list_tree.insert('', 0, iid=str(video['id']), values=values, tags=tags)
+        self._update_list_empty_state()
+
+        # Indexes shifted by one; only the visible tiles are placed again
+        self._last_grid_signature = None
+        self._update_grid_view()
+
+    def extend_videos(self, videos: List[Dict[str, Any]]):
+        """Add a further page of videos after the ones already shown.
+        
+        Tiles already on screen keep their positions, so the grid only grows
+        its scroll region and fills any newly visible rows.
+        
+        Args:
+            videos: Video metadata dicts, in display order
+        """
+        if not videos:
+            return
+        self._video_data.extend(videos)
+        self._video_by_id.update((v['id'], v) for v in videos)
+
+        insert = self.list_tree.insert
+        row = self._list_row
+        for video in videos:
+            values, tags = row(video)
+            insert('', tk.END, iid=str(video['id']), values=values, tags=tags)
+        self._update_list_empty_state()
+
+        # No layout yet (first page still pending): it is built from video_data
+        if self._last_grid_signature is None:
+            return
+        cols = self._grid_cols
+        self._last_grid_signature = (cols, len(self.video_data),
+                                     hash(tuple(v['id'] for v in self.video_data)))
+        rows = (len(self.video_data) + cols - 1) // cols
+        self.grid_canvas.configure(scrollregion=(
+            0, 0, cols * self.GRID_CELL_WIDTH, rows * self.GRID_ROW_HEIGHT
+        ))
+        self._grid_visible = None
+        self._recycle_grid()
+
+    def remove_video(self, video_id: int):
+        """Drop one deleted video from all views without reloading them.
+        
+        Args:
+            video_id: Database video ID
+        """
+        video = self._video_by_id.pop(video_id, None)
+        if video is None:
+            return
+        self._video_data.remove(video)
+        self._path_exists.pop(video.get('path', ''), None)
+
+        iid = str(video_id)
+        if self.list_tree.exists(iid):
+            self.list_tree.delete(iid)
+        self._update_list_empty_state()
+
+        self.timeline_cache.pop(video_id, None)
+        if self.selected_video_id == video_id:
+            self.selected_video_id = None
+            self._clear_timeline()
+
+        # Later indexes shifted by one; only the visible tiles are placed again
+        self._last_grid_signature = None
+        self._update_grid_view()
+
+    def _video_exists(self, video_path: str) -> bool:
+        """Check if a video file exists, remembering the answer until the next load.
+        
+        Only visible tiles and the selected video ask, so a reload or search
+        doesn't stat (or list the folders of) every video in the results.
+        """
+        exists = self._path_exists.get(video_path)
+        if exists is None:
+            exists = self._path_exists[video_path] = os.path.exists(video_path)
+        return exists
+
     def _update_grid_view(self):
         """Update grid view with current videos."""
-        # Clear existing widgets
-        for widget in self.grid_scrollable.winfo_children():
-            widget.destroy()
-
         if not self.video_data:
-            label = ttk.Label(self.grid_scrollable, text='No videos loaded')
-            label.pack(pady=20)
+            self._last_grid_signature = None
+            self._reset_grid()
+            self.grid_canvas.create_text(20, 20, text='No videos loaded', anchor=tk.NW,
+                                         tags=('empty',))
+            self.grid_canvas.configure(scrollregion=(0, 0, 0, 0))
             return
 
+        cols = self._calculate_grid_cols()
+
+        # Same columns and same videos: the current layout is still valid
+        signature = (cols, len(self.video_data), hash(tuple(v['id'] for v in self.video_data)))
+        if signature == self._last_grid_signature:
+            return
+        self._last_grid_signature = signature
+
+        self._reset_grid()
+        self._grid_cols = cols
+
+        # Scrollregion covers every row, but only visible rows get widgets
+        rows = (len(self.video_data) + cols - 1) // cols
+        self.grid_canvas.configure(scrollregion=(
+            0, 0, cols * self.GRID_CELL_WIDTH, rows * self.GRID_ROW_HEIGHT
+        ))
+        self._recycle_grid()
+
+    def _reset_grid(self):
+        """Return every placed tile to the pool and drop pending thumbnail requests."""
+        # Drop thumbnail requests from the previous layout; visible tiles re-queue later
+        for video_path in self.thumbnail_loader.cancel_pending():
+            self._in_flight.discard(video_path)
+
+        # Return every placed tile to the pool; rows are reassigned by _recycle_grid
+        for idx in list(self._grid_placed):
+            self._release_grid_tile(idx)
+        self._grid_visible = None
+        self.grid_canvas.delete('empty')
+
+    def _calculate_grid_cols(self) -> int:
+        """Calculate the number of grid columns for the current width.
+        
+        Returns:
+            Number of columns
+        """
         # Force geometry update to get correct sizes
         self.parent.update_idletasks()
 
@@ -272,11 +586,8 @@ class UIPreview:
         # Account for scrollbar width (~17px) and margins
         usable_width = available_width - 30
 
-        # Each column needs: image (145) + padding (10) = 155px minimum
-        # Larger thumbnails while maintaining 4 per row on standard window
-        thumbnail_width = 145
-        column_spacing = 10  # padx=5 on both sides = 10 total
-        column_width = thumbnail_width + column_spacing
+        # Each column needs: tile (thumbnail + padding + border) + spacing
+        column_width = self.GRID_CELL_WIDTH
 
         # Calculate how many complete columns fit
         cols = max(1, usable_width // column_width)
@@ -286,181 +597,345 @@ class UIPreview:
         if width < 1:
             width = available_width
 
-        max_cols = 4  # Default maximum
-        for threshold, col_count in sorted(self.GRID_COLS.items()):
-            if width >= threshold:
-                max_cols = col_count
+        # Largest breakpoint not above width; default maximum of 4 below the first one
+        idx = bisect.bisect_right(self.GRID_COLS_THRESHOLDS, width) - 1
+        max_cols = self.GRID_COLS_SORTED[idx][1] if idx >= 0 else 4
 
         # Don't exceed maximum, but allow up to what fits
         cols = min(cols, max_cols)
+        return cols
 
-        # Configure grid column weights for equal distribution
-        for col in range(cols):
-            self.grid_scrollable.columnconfigure(col, weight=1)
-
-        # Create grid layout
-        for idx, video in enumerate(self.video_data):
-            row = idx // cols
-            col = idx % cols
-
-            # Get category and corresponding color
-            category = video.get('category', 'other')
-            bg_color = self.CATEGORY_COLORS.get(category, self.CATEGORY_COLORS['other'])
-
-            # Use tk.Frame to support background color
-            frame = tk.Frame(self.grid_scrollable, relief=tk.RAISED, borderwidth=2, bg=bg_color)
-            frame.grid(row=row, column=col, padx=5, pady=5, sticky='ew')
-
-            # Generate and display thumbnail (145x82 - larger for better visibility)
-            thumb_label = tk.Label(frame, background=bg_color, width=145, height=82)
-            thumb_label.pack(padx=5, pady=5)
-
-            # Generate thumbnail in background
-            video_path = video.get('path', '')
-            if video_path and Path(video_path).exists():
-                if FFMPEG_AVAILABLE:
-                    # Queue thumbnail for asynchronous loading
-                    self.thumbnail_loader.queue_thumbnail(
-                        video_path,
-                        lambda path, photo,
-                        lbl=thumb_label: self._on_thumbnail_loaded(path, photo, lbl)
-                    )
-                    # Show placeholder while loading
-                    placeholder = self.thumbnail_loader.get_placeholder_image()
-                    thumb_label.config(image=placeholder, text='Loading...')
-                    thumb_label.image = placeholder
-                    self.thumbnail_labels[video_path] = thumb_label
-                else:
-                    # FFmpeg not available - show placeholder
-                    filename = Path(video_path).name
-                    thumb_label.config(text=filename, bg=bg_color,
-                                       foreground='white', font=('Arial', 8))
-            else:
-                thumb_label.config(text='[Invalid path]', foreground='white')
+    def _on_grid_scroll(self, *args):
+        """Scroll the grid canvas from the scrollbar and refresh visible rows."""
+        self.grid_canvas.yview(*args)
+        self._recycle_grid()
 
-            # Title
-            title_text = video.get('title', 'Unknown')[:25]
-            title_label = ttk.Label(frame, text=title_text, background=bg_color,
-                                    justify=tk.CENTER, wraplength=150)
-            title_label.pack(pady=5)
+    def _recycle_grid(self, _event=None):
+        """Place tiles on the rows intersecting the viewport, recycling the rest."""
+        if not self.video_data:
+            return
+
+        cols = self._grid_cols
+        row_height = self.GRID_ROW_HEIGHT
+        top_row = int(self.grid_canvas.canvasy(0) // row_height)
+        first_row = max(0, top_row - self.GRID_OVERSCAN_ROWS)
+        last_row = (top_row + self.grid_canvas.winfo_height() // row_height + 1
+                    + self.GRID_OVERSCAN_ROWS)
+        visible = range(first_row * cols, min(len(self.video_data), (last_row + 1) * cols))
+
+        # Scrolling within the same rows needs no tile changes
+        if visible == self._grid_visible:
+            return
+        self._grid_visible = visible
 
-            # Bind click
-            frame.bind('<Button-1>', lambda e, vid=video['id']: self._on_grid_selection(vid))
-            thumb_label.bind('<Button-1>', lambda e, vid=video['id']: self._on_grid_selection(vid))
-            title_label.bind('<Button-1>', lambda e, vid=video['id']: self._on_grid_selection(vid))
+        # Tiles that scrolled out of view go back to the pool
+        for idx in [i for i in self._grid_placed if i not in visible]:
+            self._release_grid_tile(idx)
 
-        self.grid_scrollable.update_idletasks()
-        self.grid_canvas.configure(scrollregion=self.grid_canvas.bbox('all'))
+        for idx in visible:
+            if idx in self._grid_placed:
+                continue
+            if self._grid_widget_pool:
+                tile = self._grid_widget_pool.pop()
+            else:
+                tile = self._create_grid_tile()
+            self._show_grid_tile(tile, idx)
+            self._grid_placed[idx] = tile
+
+    def _create_grid_tile(self) -> Tuple[int, int, int, int]:
+        """Create a reusable grid tile drawn as canvas items."""
+        canvas = self.grid_canvas
+        rect_id = canvas.create_rectangle(0, 0, 0, 0, outline='#999999', width=2,
+                                          tags=('vid',))
+        image_id = canvas.create_image(0, 0, anchor=tk.N, tags=('vid',))
+        status_id = canvas.create_text(0, 0, fill='white', font=('Arial', 8),
+                                       width=self.GRID_TILE_WIDTH - 20, tags=('vid',))
+        title_id = canvas.create_text(0, 0, anchor=tk.N, justify=tk.CENTER,
+                                      width=150, tags=('vid',))
+        return rect_id, image_id, status_id, title_id
+
+    def _show_grid_tile(self, tile: Tuple[int, int, int, int], idx: int):
+        """Configure a pooled tile for the video at idx and move it into place."""
+        canvas = self.grid_canvas
+        rect_id, image_id, status_id, title_id = tile
+        video = self.video_data[idx]
+        row, col = divmod(idx, self._grid_cols)
+
+        # Get category and corresponding color
+        category = video.get('category', 'other')
+        bg_color = self._cat_color[category]
+
+        # Tile geometry
+        x = col * self.GRID_CELL_WIDTH + self.GRID_TILE_PAD
+        y = row * self.GRID_ROW_HEIGHT + self.GRID_TILE_PAD
+        center_x = x + self.GRID_TILE_WIDTH // 2
+        thumb_center_y = y + 5 + ThumbnailLoader.THUMB_HEIGHT // 2
+
+        tags = ('vid', f"v{video['id']}")
+        for item in tile:
+            canvas.itemconfigure(item, tags=tags, state='normal')
+        canvas.coords(rect_id, x, y, x + self.GRID_TILE_WIDTH, y + self.GRID_TILE_HEIGHT)
+        canvas.coords(image_id, center_x, y + 5)
+        canvas.coords(status_id, center_x, thumb_center_y)
+        canvas.coords(title_id, center_x, y + ThumbnailLoader.THUMB_HEIGHT + 15)
+        canvas.itemconfigure(rect_id, fill=bg_color)
+        canvas.itemconfigure(title_id, text=video.get('title', 'Unknown')[:25])
+
+        if self._grid_placeholder is None:
+            self._grid_placeholder = self.thumbnail_loader.get_placeholder_image()
+        canvas.itemconfigure(image_id, image=self._grid_placeholder)
+        self._grid_images[image_id] = self._grid_placeholder
+
+        # Generate thumbnail in background
+        video_path = video.get('path', '')
+        if video_path and self._video_exists(video_path):
+            if FFMPEG_AVAILABLE:
+                self.thumbnail_tiles[video_path] = tile
+                self._tile_paths[tile] = video_path
+                cached = self._get_cached_photo(video_path)
+                if cached is not None:
+                    canvas.itemconfigure(image_id, image=cached)
+                    canvas.itemconfigure(status_id, text='')
+                    self._grid_images[image_id] = cached
+                    return
+                # Show placeholder while loading
+                canvas.itemconfigure(status_id, text='Loading...')
+                # Queue thumbnail for asynchronous loading, unless already requested
+                if video_path not in self._in_flight:
+                    self._in_flight.add(video_path)
+                    self.thumbnail_loader.queue_thumbnail(video_path, self._on_thumbnail_loaded)
+                    if self._thumbnail_poll_id is None:
+                        self._thumbnail_poll_id = self._after(self.THUMBNAIL_POLL_MS,
+                                                              self._drain_thumbnail_queue)
+            else:
+                # FFmpeg not available - show placeholder
+                canvas.itemconfigure(status_id, text=Path(video_path).name)
+        else:
+            canvas.itemconfigure(status_id, text='[Invalid path]')
+
+    def _release_grid_tile(self, idx: int):
+        """Hide the tile placed at idx and return it to the pool."""
+        tile = self._grid_placed.pop(idx)
+        video_path = self._tile_paths.pop(tile, None)
+        if video_path is not None and self.thumbnail_tiles.get(video_path) is tile:
+            del self.thumbnail_tiles[video_path]
+        for item in tile:
+            self.grid_canvas.itemconfigure(item, state='hidden', tags=('vid',))
+        self._grid_widget_pool.append(tile)
+
+    def _on_canvas_click(self, event):
+        """Resolve the clicked tile's video id from its tags."""
+        for tag in event.widget.gettags('current'):
+            if tag.startswith('v') and tag[1:].isdigit():
+                self._on_grid_selection(int(tag[1:]))
+                return
 
     def _update_list_view(self):
         """Update list view with current videos."""
         # Clear existing items
-        for widget in self.list_scrollable.winfo_children():
-            widget.destroy()
+        self.list_tree.delete(*self.list_tree.get_children())
 
-        if not self.video_data:
-            label = ttk.Label(self.list_scrollable, text='No videos loaded')
-            label.pack(pady=20)
-            return
-
-        # Add videos as custom rows
+        insert = self.list_tree.insert
+        row = self._list_row
         for video in self.video_data:
-            category = video.get('category', 'other')
-            bg_color = self.CATEGORY_COLORS.get(category, self.CATEGORY_COLORS['other'])
-
-            # Create row frame with category color background
-            row_frame = tk.Frame(self.list_scrollable, bg=bg_color, relief=tk.RAISED, borderwidth=1)
-            row_frame.pack(fill=tk.X, padx=3, pady=2)
+            values, tags = row(video)
+            insert('', tk.END, iid=str(video['id']), values=values, tags=tags)
+        self._update_list_empty_state()
+
+    def _update_list_empty_state(self):
+        """Show the 'No videos loaded' notice while the list has no rows."""
+        if self.video_data:
+            self._list_empty_label.place_forget()
+        else:
+            self._list_empty_label.place(relx=0.5, y=40, anchor=tk.N)
 
-            # Format extension
-            ext = video['path'].split('.')[-1].upper() if '.' in video['path'] else '?'
-            
-            # Format rating
-            rating_stars = '★' * video.get('rating', 0) + '☆' * (5 - video.get('rating', 0))
+    def _list_row(self, video: Dict[str, Any]) -> Tuple[tuple, tuple]:
+        """Format the list view values and tags for a video.
+        
+        Args:
+            video: Video metadata dict
             
-            # Format notes preview
-            notes_preview = video.get('notes', '')[:40]
+        Returns:
+            Tuple of (column values, row tags)
+        """
+        vget = video.get
+        category = vget('category', 'other')
 
-            # Create text for row
-            title = video.get('title', 'Unknown')
-            duration = video.get('duration', '')
-            
-            # Format text with columns
-            row_text = f"{ext:5} | {title:40} | {duration:10} | {category:10} | {rating_stars:5} | {notes_preview}"
-
-            # Create label with formatted text
-            label = tk.Label(
-                row_frame,
-                text=row_text,
-                bg=bg_color,
-                background=bg_color,
-                fg='#333333',
-                font=('Courier', 9),
-                anchor=tk.W,
-                justify=tk.LEFT,
-                padx=10,
-                pady=5
-            )
-            label.pack(fill=tk.X)
+        # Format extension
+        path = video['path']
+        ext = path.split('.')[-1].upper() if '.' in path else '?'
+
+        # Format rating
+        rating_stars = self._RATING_STARS[max(0, min(vget('rating', 0), 5))]
 
-            # Bind click event to label for selection
-            label.bind('<Button-1>', lambda e, vid=video['id']: self._on_list_row_click(vid))
-            row_frame.bind('<Button-1>', lambda e, vid=video['id']: self._on_list_row_click(vid))
+        values = (ext, vget('title', 'Unknown'), vget('duration', ''),
+                  category, rating_stars, vget('notes', '')[:40])
+        return values, (self._cat_tag[category],)
 
-    def _generate_timeline_threaded(self, video: Dict[str, Any]):
-        """Generate timeline frames in a separate thread."""
+    def update_video(self, video_id: int, updated_fields: Dict[str, Any]):
+        """Apply edited fields to one video in place, without reloading every view.
+        
+        Args:
+            video_id: Database video ID
+            updated_fields: Fields that changed
+        """
+        video = self._video_by_id.get(video_id)
+        if video is None:
+            return
+        video.update(updated_fields)
+
+        iid = str(video_id)
+        if self.list_tree.exists(iid):
+            values, tags = self._list_row(video)
+            self.list_tree.item(iid, values=values, tags=tags)
+
+        # Only a tile currently on screen needs redrawing; others are drawn when shown
+        for idx, (rect_id, _, _, title_id) in self._grid_placed.items():
+            if self.video_data[idx]['id'] == video_id:
+                self.grid_canvas.itemconfigure(
+                    rect_id, fill=self._cat_color[video.get('category', 'other')])
+                self.grid_canvas.itemconfigure(
+                    title_id, text=video.get('title', 'Unknown')[:25])
+                break
+
+    def _on_list_select(self, _event):
+        """Resolve the selected row's video id from its item id."""
+        selection = self.list_tree.selection()
+        if selection:
+            self._on_list_row_click(int(selection[0]))
+
+    def _generate_timeline_threaded(self, video: Dict[str, Any], force: bool = False):
+        """Generate timeline frames in a separate thread.
+        
+        Args:
+            video: Video to build the timeline for
+            force: Extract the frames again even if the timeline is cached
+        """
         video_id = video.get('id')
 
-        # Check if timeline is already cached
-        if video_id in self.timeline_cache:
-            cached_data = self.timeline_cache[video_id]
+        # Show the timeline right away if all its frames are still decoded; otherwise
+        # the worker decodes the cached frames (or generates them) off the Tk thread
+        cached_data = None if force else self.timeline_cache.get(video_id)
+        photos = self._timeline_photo_cache.get(video_id) if cached_data else None
+        if photos and len(photos) == len(cached_data['frames']):
             logger.info("Loading cached timeline for video %d", video_id)
-            # Display cached frames immediately without regeneration
-            self._display_cached_timeline(video, cached_data['frames'], cached_data['duration'])
+            # A generation still running for another video must not draw over this one
+            self._timeline_gen += 1
+            self._timeline_photo_cache.move_to_end(video_id)
+            self._display_cached_timeline(cached_data, photos)
             return
 
-        # Stop any previous thread
+        # Stop any previous thread and drop its pending frame extractions. The old
+        # worker keeps its own (now set) event, so it can't miss the stop while
+        # still draining its futures; no need to block the UI thread joining it
         self.timeline_stop_event.set()
-        if self.timeline_generation_thread and self.timeline_generation_thread.is_alive():
-            self.timeline_generation_thread.join(timeout=1.0)
+        for future in self._timeline_futures:
+            future.cancel()
 
-        # Clear previous frames and timeline data
-        for widget in self.timeline_scroll_frame.winfo_children():
-            widget.destroy()
-        self.timeline_photos.clear()
+        # Clear previous frames and timeline data; the worker decodes this video's
+        # frames again, so any partial set kept for it is dropped
+        self._clear_timeline()
+        self._timeline_photo_cache.pop(video_id, None)
 
-        # Reset stop event and start new thread
-        self.timeline_stop_event.clear()
+        # Fresh stop event for the new thread
+        self.timeline_stop_event = threading.Event()
+        self._timeline_gen += 1
         self.timeline_generation_thread = threading.Thread(
             target=self._timeline_generation_worker,
-            args=(video,),
+            args=(video, self._timeline_gen, self.timeline_stop_event, force),
             daemon=True
         )
         self.timeline_generation_thread.start()
 
-    def _timeline_generation_worker(self, video: Dict[str, Any]):
+        # Start polling for worker updates
+        if self._timeline_poll_id is None:
+            self._timeline_poll_id = self._after(self.TIMELINE_POLL_MS,
+                                                 self._drain_timeline_queue)
+
+    def _timeline_generation_worker(self, video: Dict[str, Any], gen: int,
+                                    stop_event: threading.Event, force: bool = False):
         """Worker thread that generates timeline frames."""
         try:
-            self._load_timeline(video)
+            self._load_timeline(video, gen, stop_event, force)
+        except CancelledError:
+            logger.debug("Timeline generation %d cancelled", gen)
         except (OSError, ValueError, KeyError) as e:
             logger.error("Error in timeline generation thread: %s", e)
 
-    def _load_timeline(self, video: Dict[str, Any]):
-        """Load and display timeline frames for a video. Called from worker thread."""
+    def _post_timeline(self, gen: int, callback: Callable, *args):
+        """Queue a timeline UI update from the worker thread.
+        
+        Args:
+            gen: Timeline generation the update belongs to
+            callback: UI-thread method to call
+            *args: Arguments for the callback
+        """
+        self._timeline_queue.put((gen, callback, args))
+
+    def _drain_timeline_queue(self):
+        """Apply queued timeline updates in one batch. Called from UI thread."""
+        frames_added = False
+        for _ in range(self.TIMELINE_DRAIN_LIMIT):
+            try:
+                gen, callback, args = self._timeline_queue.get_nowait()
+            except queue.Empty:
+                break
+            if gen != self._timeline_gen:
+                continue  # Update from a previous selection
+            callback(*args)
+            frames_added = frames_added or callback == self._add_timeline_frame_and_progress
+
+        # Single scroll region update for every frame added in this batch
+        if frames_added:
+            self._update_timeline_scrollregion()
+
+        worker_alive = (self.timeline_generation_thread is not None
+                        and self.timeline_generation_thread.is_alive())
+        if worker_alive or not self._timeline_queue.empty():
+            self._timeline_poll_id = self._after(self.TIMELINE_POLL_MS,
+                                                 self._drain_timeline_queue)
+        else:
+            self._timeline_poll_id = None
+
+    def _set_timeline_status(self, text: str, foreground: str):
+        """Update the timeline progress label. Called from UI thread."""
+        self.timeline_progress.config(text=text, foreground=foreground)
+
+    def _load_timeline(self, video: Dict[str, Any], gen: int, stop_event: threading.Event,
+                       force: bool = False):
+        """Load and display timeline frames for a video. Called from worker thread.
+        
+        Args:
+            video: Video to build the timeline for
+            gen: Timeline generation the work belongs to
+            stop_event: Set when this generation is superseded or the view closes
+            force: Extract the frames again even if the timeline is persisted
+        """
+        # Timeline built earlier this session whose decoded frames were evicted
+        video_id = video.get('id')
+        entry = None if force else self.timeline_cache.get(video_id)
+        if entry is not None:
+            if self._show_timeline_entry(video, gen, entry):
+                return
+            self.timeline_cache.pop(video_id, None)
+
         if not FFMPEG_AVAILABLE:
-            self.parent.after(0, self._update_timeline_ui, video, [], 0)
+            self._post_timeline(gen, self._update_timeline_ui, video, [], 0)
             return
 
         video_path = video.get('path', '')
-        if not video_path or not Path(video_path).exists():
-            self.parent.after(0, self._update_timeline_ui, video, [], 0)
+        if not video_path or not self._video_exists(video_path):
+            self._post_timeline(gen, self._update_timeline_ui, video, [], 0)
+            return
+
+        # Timeline persisted by an earlier session for this exact file
+        store_key = self._timeline_store_key(video_path)
+        if not force and self._show_stored_timeline(video, gen, store_key):
             return
 
         # Show loading message via UI thread
-        self.parent.after(0, lambda: self.timeline_progress.config(
-            text='Generating timeline frames...',
-            foreground='#2c3e50'
-        ))
+        self._post_timeline(gen, self._set_timeline_status,
+                            'Generating timeline frames...', '#2c3e50')
 
         try:
             # Generate timeline frames progressively
@@ -478,251 +953,418 @@ class UIPreview:
                 num_frames = max(1, round(duration_minutes))  # At least 1 frame
                 num_frames = min(num_frames, 120)  # Cap at 120 frames max
 
-                for i in range(num_frames):
-                    # Check if thread should stop
-                    if self.timeline_stop_event.is_set():
+                # Calculate timestamps (and their labels) and extract all frames in parallel
+                timestamps = self._timeline_positions(num_frames, duration)
+                labels = self._format_timestamps(timestamps)
+                futures = {
+                    self._timeline_pool.submit(
+                        self._extract_timeline_frame, video_path, i, timestamp
+                    ): i
+                    for i, timestamp in enumerate(timestamps)
+                }
+                self._timeline_futures = list(futures)
+
+                generated = {}
+                for completed, future in enumerate(as_completed(futures), start=1):
+                    # Check if thread should stop (cancelled, or another timeline started)
+                    if stop_event.is_set() or gen != self._timeline_gen:
+                        for pending in futures:
+                            pending.cancel()
                         logger.info("Timeline generation cancelled by user")
                         return
+                    if future.cancelled():
+                        continue
 
-                    # Calculate timestamp
-                    prog = 0.05 + (i / (num_frames - 1)) * 0.9 if num_frames > 1 else 0.5
-                    timestamp = duration * prog
-
-                    # Generate frame (may fail due to timeout)
-                    frame_path = ThumbnailGenerator.generate_single_timeline_frame(
-                        video_path,
-                        frame_index=i,
-                        timestamp=timestamp
-                    )
+                    # Frame generation may fail due to timeout
+                    i = futures[future]
+                    frame_path, img = future.result()
                     if frame_path:
-                        frame_paths.append(frame_path)
-                        # Update UI immediately with the new frame (progressive display)
-                        self.parent.after(0, self._add_timeline_frame, video, frame_path, i,
-                                          calculated_duration, num_frames)
+                        generated[i] = frame_path
                     else:
+                        frame_path = None
                         failed_frames.append(i)
                         logger.warning("Failed to generate frame %d from %s", i,
                                        Path(video_path).name)
 
-                    # Update progress via UI thread
-                    progress = int(((i + 1) / num_frames) * 100)
-                    self.parent.after(0, lambda p=i+1, max_f=num_frames, pr=progress,
-                                      fail=len(failed_frames):
-                        self.timeline_progress.config(
-                            text=f'Generating timeline frames ({p}/{max_f})... {pr}%'
-                            f'{" (failures: " + str(fail) + ")" if fail > 0 else ""}',
-                            foreground='#2c3e50'
-                        )
-                    )
+                    # One UI update per frame: the decoded frame (progressive display) and progress
+                    self._post_timeline(gen, self._add_timeline_frame_and_progress, video,
+                                        frame_path, img, i, labels[i], completed, num_frames,
+                                        len(failed_frames))
+
+                # Keep frames in timeline order for the cache, each with the label of
+                # its own position (failed frames leave gaps)
+                frame_paths = [generated[i] for i in sorted(generated)]
+                frame_labels = [labels[i] for i in sorted(generated)]
             else:
                 # Fallback if duration detection fails - use default 8 frames
                 frame_paths = ThumbnailGenerator.generate_timeline_frames(
                     video_path,
                     num_frames=8
                 )
+                # Decode all frames in parallel on the pool; only PhotoImage creation is left
+                # for the UI thread. Frames that can't be read are dropped here
+                prepared = list(self._timeline_pool.map(self._prepare_timeline_frame,
+                                                        frame_paths))
+                usable = [(path, img) for path, img in zip(frame_paths, prepared)
+                          if img is not None]
+                frame_paths = [path for path, _ in usable]
+                images = [img for _, img in usable]
                 # Update UI with all generated frames
-                self.parent.after(0, self._update_timeline_ui, video,
-                                  frame_paths, calculated_duration)
+                self._post_timeline(gen, self._update_timeline_ui, video,
+                                    frame_paths, calculated_duration, images)
                 return
 
             # Cache the generated frames for this video
-            video_id = video.get('id')
             if video_id and frame_paths:
-                self.timeline_cache[video_id] = {
-                    'frames': frame_paths,
-                    'duration': calculated_duration
-                }
+                entry = {'frames': frame_paths, 'labels': frame_labels,
+                         'duration': calculated_duration}
+                self.timeline_cache[video_id] = entry
+                self._store_timeline(store_key, entry)
                 logger.info("Cached %d timeline frames for video %d", len(frame_paths), video_id)
 
             # Update UI with final message
             if frame_paths:
-                if calculated_duration > 0:
-                    duration_str = f"{int(calculated_duration // 60)}:{int(
-                        calculated_duration % 60):02d}"
-                else:
-                    duration_str = "0:00"
-                self.parent.after(0, lambda frames=len(frame_paths), dur_str=duration_str:
-                    self.timeline_progress.config(
-                        text=f"Timeline ({frames} frames) - Duration: {dur_str}",
-                        foreground='#27ae60'
-                    )
+                duration_str = self._format_duration(calculated_duration)
+                self._post_timeline(
+                    gen, self._set_timeline_status,
+                    f"Timeline ({len(frame_paths)} frames) - Duration: {duration_str}",
+                    '#27ae60'
                 )
             else:
-                self.parent.after(0, lambda:
-                    self.timeline_progress.config(
-                        text='Could not generate timeline frames',
-                        foreground='#e67e22'
-                    )
-                )
+                self._post_timeline(gen, self._set_timeline_status,
+                                    'Could not generate timeline frames', '#e67e22')
 
         except (OSError, ValueError, KeyError) as e:
             logger.error("Error loading timeline: %s", e)
-            self.parent.after(0, lambda err=str(e): self.timeline_progress.config(
-                text=f'Error: {err[:50]}',
-                foreground='#ff6b6b'
-            ))
-
-    def _display_cached_timeline(self, _video: Dict[str, Any], frame_paths: List[str],
-                                 duration_sec: float):
-        """Display cached timeline frames without regeneration. Called from UI thread."""
-        # Clear previous frames
-        for widget in self.timeline_scroll_frame.winfo_children():
-            widget.destroy()
-        self.timeline_photos.clear()
+            self._post_timeline(gen, self._set_timeline_status,
+                                f'Error: {str(e)[:50]}', '#ff6b6b')
 
-        if not frame_paths:
-            self.timeline_progress.config(
-                text='No cached frames available',
-                foreground='#e67e22'
-            )
-            return
-
-        # Display all cached frames with timestamps
-        cols_per_row = 7
-        for i, frame_path in enumerate(frame_paths):
+    @staticmethod
+    def _timeline_positions(num_frames: int, duration_sec: float) -> List[float]:
+        """Timestamps of the timeline frames, spread over 5%-95% of the video.
+        
+        Args:
+            num_frames: Number of frames in the timeline
+            duration_sec: Video duration in seconds (0 if unknown)
+            
+        Returns:
+            Timestamp in seconds of each frame
+        """
+        if duration_sec <= 0:
+            return [0.0] * num_frames
+        if num_frames == 1:
+            return [duration_sec * 0.5]
+        step = 0.9 / max(num_frames - 1, 1)
+        return [duration_sec * (0.05 + i * step) for i in range(num_frames)]
+
+    @staticmethod
+    def _format_timestamps(timestamps: List[float]) -> List[str]:
+        """Format timestamps as m:ss labels in a single pass.
+        
+        Args:
+            timestamps: Timestamps in seconds
+            
+        Returns:
+            Label for each timestamp
+        """
+        return [f"{m}:{s:02d}" for m, s in (divmod(int(t), 60) for t in timestamps)]
+
+    @staticmethod
+    def _format_duration(duration_sec: float) -> str:
+        """Format a duration as m:ss ("0:00" if unknown)."""
+        if duration_sec <= 0:
+            return "0:00"
+        minutes, seconds = divmod(int(duration_sec), 60)
+        return f"{minutes}:{seconds:02d}"
+
+    def _load_timeline_cache(self) -> 'OrderedDict[str, Dict[str, Any]]':
+        """Load the persisted timeline cache.
+        
+        No frame files are checked here; _show_stored_timeline does that on a
+        worker for the entry it uses.
+        
+        Returns:
+            Timeline cache keyed by _timeline_store_key, least recently used first
+        """
+        try:
+            # json.loads takes the UTF-8 bytes directly; no text wrapper or decode pass
+            data = json.loads(self._cache_file.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Could not read timeline cache %s: %s", self._cache_file, e)
+            return {}
+
+        cache = OrderedDict()
+        for key, entry in data.items():
+            # Entries keyed by bare video id (older versions) can't be matched reliably
+            if '|' not in key:
+                continue
             try:
-                if not Path(frame_path).exists():
-                    logger.warning("Cached frame file not found: %s", frame_path)
+                frames = list(entry['frames'])
+                labels = [str(label) for label in entry['labels']]
+                if len(labels) != len(frames):
                     continue
+                cache[key] = {'frames': frames, 'labels': labels,
+                              'duration': float(entry['duration'])}
+            except (KeyError, TypeError, ValueError):
+                continue
+        while len(cache) > self.TIMELINE_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+        logger.info("Loaded %d cached timelines from %s", len(cache), self._cache_file)
+        return cache
+
+    @staticmethod
+    def _timeline_store_key(video_path: str) -> str:
+        """Key of a video's persisted timeline: its path plus its content key.
+        
+        The content key changes when the file does, so stale frames are never
+        reused, and paths don't collide between databases the way video ids do.
+        
+        Args:
+            video_path: Path to video file
+            
+        Returns:
+            Cache key
+        """
+        return f"{video_path}|{ThumbnailGenerator._cache_key(video_path)}"
+
+    def _store_timeline(self, store_key: str, entry: Dict[str, Any]):
+        """Persist a generated timeline, evicting the least recently used ones."""
+        with self._timeline_store_lock:
+            self._timeline_store[store_key] = entry
+            self._timeline_store.move_to_end(store_key)
+            while len(self._timeline_store) > self.TIMELINE_CACHE_MAX_ENTRIES:
+                self._timeline_store.popitem(last=False)
+        self._schedule_timeline_cache_flush()
+
+    def _show_stored_timeline(self, video: Dict[str, Any], gen: int, store_key: str) -> bool:
+        """Show a persisted timeline if all its frames are still readable.
+        
+        Called from worker thread; frames are decoded on the timeline pool.
+        
+        Args:
+            video: Video the timeline belongs to
+            gen: Timeline generation the work belongs to
+            store_key: Key from _timeline_store_key
+            
+        Returns:
+            True if the timeline was shown, False if it must be generated
+        """
+        with self._timeline_store_lock:
+            entry = self._timeline_store.get(store_key)
+            if entry is not None:
+                self._timeline_store.move_to_end(store_key)
+        if entry is None:
+            return False
+
+        if not self._show_timeline_entry(video, gen, entry):
+            # Frames were cleaned up or damaged: forget the entry and regenerate
+            with self._timeline_store_lock:
+                self._timeline_store.pop(store_key, None)
+            return False
 
-                img = Image.open(frame_path)
-                photo = ImageTk.PhotoImage(img)
-
-                # Calculate timestamp
-                if duration_sec > 0:
-                    progress = 0.05 + (i / (len(frame_paths) - 1)) * 0.9 if len(
-                        frame_paths) > 1 else 0.5
-                    timestamp_sec = duration_sec * progress
-                    minutes = int(timestamp_sec // 60)
-                    seconds = int(timestamp_sec % 60)
-                    timestamp_str = f"{minutes}:{seconds:02d}"
-                else:
-                    timestamp_str = "0:00"
-
-                # Create container for frame and timestamp
-                frame_container = tk.Frame(
-                    self.timeline_scroll_frame,
-                    bg='#f0f0f0'
-                )
-                row = i // cols_per_row
-                col = i % cols_per_row
-                frame_container.grid(row=row, column=col, padx=2, pady=5)
-
-                # Create frame button
-                frame_btn = tk.Label(
-                    frame_container,
-                    image=photo,
-                    bg='#f0f0f0',
-                    cursor='hand2',
-                    relief=tk.RAISED,
-                    borderwidth=1
-                )
-                frame_btn.pack()
-
-                # Add timestamp label
-                time_label = tk.Label(
-                    frame_container,
-                    text=timestamp_str,
-                    bg='#f0f0f0',
-                    fg='#2c3e50',
-                    font=('Arial', 8, 'bold')
-                )
-                time_label.pack()
+        video_id = video.get('id')
+        if video_id:
+            self.timeline_cache[video_id] = entry
+        return True
 
-                # Keep reference
-                self.timeline_photos[f"frame_{i}"] = photo
+    def _show_timeline_entry(self, video: Dict[str, Any], gen: int,
+                             entry: Dict[str, Any]) -> bool:
+        """Decode a cached timeline's frames on the pool and queue them for display.
+        
+        Called from worker thread.
+        
+        Args:
+            video: Video the timeline belongs to
+            gen: Timeline generation the work belongs to
+            entry: Cached timeline entry
+            
+        Returns:
+            True if the timeline was queued, False if a frame can't be read
+        """
+        frames = entry['frames']
+        images = list(self._timeline_pool.map(self._prepare_timeline_frame, frames))
+        if not frames or any(img is None for img in images):
+            return False
+        self._post_timeline(gen, self._update_timeline_ui, video, frames,
+                            entry['duration'], images, entry['labels'])
+        return True
+
+    def _schedule_timeline_cache_flush(self):
+        """Write the timeline cache to disk shortly, coalescing repeated updates."""
+        with self._cache_flush_lock:
+            if self._cache_flush_timer is not None:
+                self._cache_flush_timer.cancel()
+            self._cache_flush_timer = threading.Timer(self.TIMELINE_CACHE_FLUSH_DELAY,
+                                                      self._flush_timeline_cache)
+            self._cache_flush_timer.daemon = True
+            self._cache_flush_timer.start()
+
+    def _flush_timeline_cache(self):
+        """Persist frame paths, timestamp labels and durations of the timeline cache."""
+        with self._timeline_store_lock:
+            data = {
+                key: {'frames': entry['frames'], 'labels': entry['labels'],
+                      'duration': entry['duration']}
+                for key, entry in self._timeline_store.items()
+            }
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self._cache_file.with_suffix('.tmp')
+            tmp_file.write_text(json.dumps(data), encoding='utf-8')
+            tmp_file.replace(self._cache_file)
+            logger.debug("Saved %d cached timelines to %s", len(data), self._cache_file)
+        except OSError as e:
+            logger.error("Failed to save timeline cache: %s", e)
+
+    def _display_cached_timeline(self, cached_data: Dict[str, Any],
+                                 photos: Dict[int, Tuple[Any, str]]):
+        """Show a cached timeline whose frames are all still decoded. Called from UI thread.
+        
+        Args:
+            cached_data: Cached timeline entry
+            photos: PhotoImage and timestamp text of each frame, by frame index
+        """
+        # Clear previous frames; the scroll region is set once after refilling
+        self._clear_timeline(update_scrollregion=False)
 
-            except (OSError, ValueError) as e:
-                logger.warning("Error loading cached frame: %s", e)
+        for i, (photo, timestamp_str) in sorted(photos.items()):
+            # Reuse pooled canvas items for frame and timestamp
+            self._show_timeline_frame(i, photo, timestamp_str)
+            self.timeline_photos[f"frame_{i}"] = photo
 
         # Update canvas scroll region
-        self.timeline_scroll_frame.update_idletasks()
-        self.timeline_canvas.configure(
-            scrollregion=self.timeline_canvas.bbox('all')
-        )
+        self._update_timeline_scrollregion()
 
         # Display completion message
-        if duration_sec > 0:
-            duration_str = f"{int(duration_sec // 60)}:{int(duration_sec % 60):02d}"
-        else:
-            duration_str = "0:00"
+        duration_str = self._format_duration(cached_data['duration'])
         self.timeline_progress.config(
-            text=f"Timeline ({len(frame_paths)} frames - cached) - Duration: {duration_str}",
+            text=f"Timeline ({len(photos)} frames - cached) - Duration: {duration_str}",
             foreground='#27ae60'
         )
 
-    def _add_timeline_frame(self, _video: Dict[str, Any], frame_path: str, frame_index: int,
-                           duration_sec: float, total_frames: int):
-        """Add a single timeline frame to the UI progressively. Called from UI thread."""
-        try:
-            if not Path(frame_path).exists():
-                return
+    def _add_timeline_frame_and_progress(self, video: Dict[str, Any], frame_path: Optional[str],
+                                         img: Optional[Image.Image], frame_index: int,
+                                         timestamp_str: str, completed: int, total_frames: int,
+                                         failures: int):
+        """Apply one finished frame extraction. Called from UI thread.
+        
+        Args:
+            video: Video the timeline belongs to
+            frame_path: Path to the generated frame, or None if extraction failed
+            img: Decoded frame image, or None if extraction failed
+            frame_index: Frame index in the timeline
+            timestamp_str: Timestamp text shown below the frame
+            completed: Number of extractions finished so far
+            total_frames: Number of frames in the timeline
+            failures: Number of failed extractions so far
+        """
+        if frame_path is not None:
+            self._add_timeline_frame(video, frame_path, img, frame_index, timestamp_str)
 
-            img = Image.open(frame_path)
-            photo = ImageTk.PhotoImage(img)
+        progress = int((completed / total_frames) * 100)
+        self.timeline_progress.config(
+            text=f'Generating timeline frames ({completed}/{total_frames})... {progress}%'
+                 f'{" (failures: " + str(failures) + ")" if failures > 0 else ""}',
+            foreground='#2c3e50'
+        )
 
-            # Calculate timestamp
-            if duration_sec > 0:
-                progress = 0.05 + (frame_index / (total_frames - 1)
-                                   ) * 0.9 if total_frames > 1 else 0.5
-                timestamp_sec = duration_sec * progress
-                minutes = int(timestamp_sec // 60)
-                seconds = int(timestamp_sec % 60)
-                timestamp_str = f"{minutes}:{seconds:02d}"
-            else:
-                timestamp_str = "0:00"
+    def _add_timeline_frame(self, video: Dict[str, Any], frame_path: str, img: Image.Image,
+                            frame_index: int, timestamp_str: str):
+        """Add a single timeline frame to the UI progressively. Called from UI thread.
 
-            # Create container for frame and timestamp
-            frame_container = tk.Frame(
-                self.timeline_scroll_frame,
-                bg='#f0f0f0'
-            )
-            # Grid layout to allow wrapping
-            cols_per_row = 7
-            row = frame_index // cols_per_row
-            col = frame_index % cols_per_row
-            frame_container.grid(row=row, column=col, padx=2, pady=5)
-
-            # Create frame button
-            frame_btn = tk.Label(
-                frame_container,
-                image=photo,
-                bg='#f0f0f0',
-                cursor='hand2',
-                relief=tk.RAISED,
-                borderwidth=1
-            )
-            frame_btn.pack()
-
-            # Add timestamp label below frame
-            time_label = tk.Label(
-                frame_container,
-                text=timestamp_str,
-                bg='#f0f0f0',
-                fg='#2c3e50',
-                font=('Arial', 8, 'bold')
-            )
-            time_label.pack()
+        The frame is decoded by the worker; the scroll region is updated once per
+        batch by _drain_timeline_queue.
+        """
+        try:
+            photo = self._load_timeline_photo(frame_path, img)
+
+            # Reuse pooled canvas items for frame and timestamp
+            self._show_timeline_frame(frame_index, photo, timestamp_str)
 
             # Keep reference to prevent garbage collection
             self.timeline_photos[f"frame_{frame_index}"] = photo
 
-            # Update canvas scroll region
-            self.timeline_scroll_frame.update_idletasks()
-            self.timeline_canvas.configure(
-                scrollregion=self.timeline_canvas.bbox('all')
-            )
+            # Keep the decoded frame for later selections of this video
+            self._remember_timeline_photo(video.get('id'), frame_index, photo, timestamp_str)
 
         except (OSError, ValueError) as e:
             logger.warning("Error adding timeline frame: %s", e)
 
+    def _get_timeline_items(self, index: int) -> Tuple[int, int, int]:
+        """Return the pooled canvas items for index, creating items as needed.
+        
+        Args:
+            index: Frame index in the timeline
+            
+        Returns:
+            Tuple of (border rectangle, frame image, timestamp text) item ids
+        """
+        canvas = self.timeline_canvas
+        while len(self._timeline_items) <= index:
+            border_id = canvas.create_rectangle(0, 0, 0, 0, outline='#999999',
+                                                state='hidden')
+            image_id = canvas.create_image(0, 0, anchor=tk.NW, state='hidden')
+            time_id = canvas.create_text(0, 0, anchor=tk.N, fill='#2c3e50',
+                                         font=('Arial', 8, 'bold'), state='hidden')
+            self._timeline_items.append((border_id, image_id, time_id))
+        return self._timeline_items[index]
+
+    def _show_timeline_frame(self, index: int, photo, timestamp_str: str):
+        """Draw a frame image and its timestamp into the timeline cell for index.
+        
+        Args:
+            index: Frame index in the timeline
+            photo: PhotoImage of the frame
+            timestamp_str: Timestamp text shown below the frame
+        """
+        canvas = self.timeline_canvas
+        border_id, image_id, time_id = self._get_timeline_items(index)
+
+        # Wrapping layout: TIMELINE_COLS_PER_ROW cells per row
+        row, col = divmod(index, self.TIMELINE_COLS_PER_ROW)
+        x = col * self.TIMELINE_CELL_WIDTH + 4
+        y = row * self.TIMELINE_CELL_HEIGHT + 5
+        width, height = photo.width(), photo.height()
+
+        canvas.coords(border_id, x - 1, y - 1, x + width, y + height)
+        canvas.coords(image_id, x, y)
+        canvas.coords(time_id, x + width // 2, y + height + 3)
+        canvas.itemconfigure(image_id, image=photo, state='normal')
+        canvas.itemconfigure(time_id, text=timestamp_str, state='normal')
+        canvas.itemconfigure(border_id, state='normal')
+
+    def _clear_timeline(self, update_scrollregion: bool = True):
+        """Hide all pooled timeline items; they are reused by the next timeline.
+        
+        Args:
+            update_scrollregion: Shrink the scroll region now; callers that refill
+                the timeline right away update it once when they are done
+        """
+        for border_id, image_id, time_id in self._timeline_items:
+            self.timeline_canvas.itemconfigure(image_id, image='', state='hidden')
+            self.timeline_canvas.itemconfigure(time_id, state='hidden')
+            self.timeline_canvas.itemconfigure(border_id, state='hidden')
+        self.timeline_photos.clear()
+        if update_scrollregion:
+            self._update_timeline_scrollregion()
+
     def _update_timeline_ui(self, video: Dict[str, Any], frame_paths: List[str],
-                            duration_sec: float):
-        """Update timeline UI with generated frames. Called from UI thread."""
+                            duration_sec: float,
+                            images: Optional[List[Optional[Image.Image]]] = None,
+                            labels: Optional[List[str]] = None):
+        """Update timeline UI with generated frames. Called from UI thread.
+        
+        Args:
+            video: Video the timeline belongs to
+            frame_paths: Paths to the generated frames
+            duration_sec: Video duration in seconds, or 0 if unknown
+            images: Frames already decoded by the worker
+            labels: Timestamp text of each frame (spread over the duration if None)
+        """
         # Clear previous frames
-        for widget in self.timeline_scroll_frame.winfo_children():
-            widget.destroy()
-        self.timeline_photos.clear()
+        self._clear_timeline()
 
         if not FFMPEG_AVAILABLE:
             self.timeline_progress.config(
@@ -751,71 +1393,31 @@ class UIPreview:
                     duration_float = 0
 
             # Load and display frames with timestamps (wrapped layout with grid)
-            cols_per_row = 7  # Number of frames per row
+            if labels is None:
+                labels = self._format_timestamps(
+                    self._timeline_positions(len(frame_paths), duration_float))
             for i, frame_path in enumerate(frame_paths):
                 try:
-                    img = Image.open(frame_path)
-                    photo = ImageTk.PhotoImage(img)
-
-                    # Calculate timestamp for this frame
-                    if duration_float > 0:
-                        progress = 0.05 + (i / (len(frame_paths) - 1)) * 0.9 if len(
-                            frame_paths) > 1 else 0.5
-                        timestamp_sec = duration_float * progress
-                        minutes = int(timestamp_sec // 60)
-                        seconds = int(timestamp_sec % 60)
-                        timestamp_str = f"{minutes}:{seconds:02d}"
-                    else:
-                        timestamp_str = "0:00"
-
-                    # Create container for frame and timestamp
-                    frame_container = tk.Frame(
-                        self.timeline_scroll_frame,
-                        bg='#f0f0f0'
-                    )
-                    # Use grid layout to allow wrapping
-                    row = i // cols_per_row
-                    col = i % cols_per_row
-                    frame_container.grid(row=row, column=col, padx=2, pady=5)
-
-                    # Create frame button
-                    frame_btn = tk.Label(
-                        frame_container,
-                        image=photo,
-                        bg='#f0f0f0',
-                        cursor='hand2',
-                        relief=tk.RAISED,
-                        borderwidth=1
-                    )
-                    frame_btn.pack()
-
-                    # Add timestamp label below frame
-                    time_label = tk.Label(
-                        frame_container,
-                        text=timestamp_str,
-                        bg='#f0f0f0',
-                        fg='#2c3e50',
-                        font=('Arial', 8, 'bold')
-                    )
-                    time_label.pack()
+                    photo = self._load_timeline_photo(frame_path,
+                                                      images[i] if images else None)
+
+                    # Reuse pooled canvas items for frame and timestamp
+                    self._show_timeline_frame(i, photo, labels[i])
 
                     # Keep reference to prevent garbage collection
                     self.timeline_photos[f"frame_{i}"] = photo
 
+                    # Keep the decoded frame for later selections of this video
+                    self._remember_timeline_photo(video.get('id'), i, photo, labels[i])
+
                 except (OSError, ValueError) as e:
                     logger.warning("Error loading timeline frame: %s", e)
 
             # Update canvas scroll region
-            self.timeline_scroll_frame.update_idletasks()
-            self.timeline_canvas.configure(
-                scrollregion=self.timeline_canvas.bbox('all')
-            )
+            self._update_timeline_scrollregion()
 
             # Display final message with duration
-            if duration_float > 0:
-                duration_str = f"{int(duration_float // 60)}:{int(duration_float % 60):02d}"
-            else:
-                duration_str = "0:00"
+            duration_str = self._format_duration(duration_float)
             self.timeline_progress.config(
                 text=f"Timeline ({len(frame_paths)} frames) - Duration: {duration_str}",
                 foreground='#27ae60'
@@ -826,10 +1428,22 @@ class UIPreview:
                 foreground='#e67e22'
             )
 
+    def _timeline_is_current(self, video_id: int) -> bool:
+        """Check whether the timeline shown (or being built) is for video_id."""
+        if video_id != self.selected_video_id:
+            return False
+        worker_alive = (self.timeline_generation_thread is not None
+                        and self.timeline_generation_thread.is_alive())
+        return bool(self.timeline_photos) or worker_alive
+
     def _on_grid_selection(self, video_id: int):
         """Handle grid view click."""
+        video = self._video_by_id.get(video_id)
+        if video and self._timeline_is_current(video_id):
+            # Re-click on the selected video: keep the timeline already shown
+            self.on_selection_callback(video_id, video)
+            return
         self.selected_video_id = video_id
-        video = next((v for v in self.video_data if v['id'] == video_id), None)
         if video:
             # Load timeline for this video (threaded)
             self._generate_timeline_threaded(video)
@@ -838,8 +1452,11 @@ class UIPreview:
 
     def _on_list_row_click(self, video_id: int):
         """Handle click on list row."""
+        video = self._video_by_id.get(video_id)
+        if video and self._timeline_is_current(video_id):
+            self.on_selection_callback(video_id, video)
+            return
         self.selected_video_id = video_id
-        video = next((v for v in self.video_data if v['id'] == video_id), None)
         if video:
             # Load timeline for this video (threaded)
             self._generate_timeline_threaded(video)
@@ -857,78 +1474,203 @@ class UIPreview:
             # Windows: event.delta (positive = up, negative = down)
             # Linux/Unix: event.num (4 = up, 5 = down)
             if event.num == 5 or event.delta < 0:
-                self.grid_canvas.yview_scroll(3, 'units')
+                self._wheel_accum += 3
             elif event.num == 4 or event.delta > 0:
-                self.grid_canvas.yview_scroll(-3, 'units')
+                self._wheel_accum -= 3
+
+            # Coalesce rapid wheel ticks into one scroll and recycle
+            if self._wheel_pending is None:
+                self._wheel_pending = self._after(self.GRID_WHEEL_FLUSH_MS,
+                                                  self._flush_wheel_grid)
             
             # Return 'break' to prevent event propagation
             return 'break'
         except tk.TclError:
             pass
 
-    def _on_mousewheel_list(self, event):
-        """Handle mousewheel scroll in list view."""
-        # Check if list canvas is visible and has focus
+    def _flush_wheel_grid(self):
+        """Apply the accumulated wheel scroll to the grid in one step."""
+        self._wheel_pending = None
+        units, self._wheel_accum = self._wheel_accum, 0
+        if not units:
+            return
         try:
-            if not self.list_canvas.winfo_exists():
-                return
-            
-            # Determine scroll direction
-            # Windows: event.delta (positive = up, negative = down)
-            # Linux/Unix: event.num (4 = up, 5 = down)
-            if event.num == 5 or event.delta < 0:
-                self.list_canvas.yview_scroll(3, 'units')
-            elif event.num == 4 or event.delta > 0:
-                self.list_canvas.yview_scroll(-3, 'units')
-            
-            # Return 'break' to prevent event propagation
-            return 'break'
+            self.grid_canvas.yview_scroll(units, 'units')
+            self._recycle_grid()
         except tk.TclError:
             pass
 
-    def _on_thumbnail_loaded(self, video_path: str, photo, label: tk.Label):
-        """Callback when thumbnail is loaded asynchronously.
+    def _on_thumbnail_loaded(self, video_path: str, image: Optional[Image.Image]):
+        """Callback when thumbnail is loaded asynchronously. Runs on a loader worker.
         
         Args:
             video_path: Path to the video file
-            photo: PhotoImage object or None if failed
-            label: tk.Label widget to update
+            image: Decoded thumbnail, or None if failed
         """
-        try:
-            # Check if widget still exists before updating
-            if not label.winfo_exists():
-                logger.debug('Label widget no longer exists, skipping update')
-                return
+        # No Tk calls here; _drain_thumbnail_queue installs it on the UI thread
+        self._thumbnail_queue.put((video_path, image))
+        if image is not None:
+            logger.debug('Thumbnail loaded for: %s', Path(video_path).name)
+        else:
+            logger.warning('Failed to load thumbnail for: %s', video_path)
 
+    def _drain_thumbnail_queue(self):
+        """Install every thumbnail decoded since the last poll. Called from UI thread."""
+        while True:
+            try:
+                video_path, image = self._thumbnail_queue.get_nowait()
+            except queue.Empty:
+                break
+            photo = ImageTk.PhotoImage(image) if image is not None else None
+            self._update_thumbnail_on_main_thread(video_path, photo)
+
+        if self._in_flight or not self._thumbnail_queue.empty():
+            self._thumbnail_poll_id = self._after(self.THUMBNAIL_POLL_MS,
+                                                  self._drain_thumbnail_queue)
+        else:
+            self._thumbnail_poll_id = None
+
+    def _update_thumbnail_on_main_thread(self, video_path: str, photo):
+        """Update the grid tile with thumbnail image on the main thread.
+        
+        Args:
+            video_path: Path to the video file the thumbnail belongs to
+            photo: PhotoImage to display, or None if loading failed
+        """
+        self._in_flight.discard(video_path)
+        if photo:
+            self._cache_photo(video_path, photo)
+
+        # Tiles are recycled while scrolling; skip if the video is off-screen
+        tile = self.thumbnail_tiles.get(video_path)
+        if tile is None:
+            logger.debug('Tile no longer visible, skipping thumbnail update')
+            return
+
+        try:
+            _rect_id, image_id, status_id, _title_id = tile
             if photo:
-                # Schedule update on main thread
-                self.parent.after(0, lambda: self._update_thumbnail_on_main_thread(label, photo))
-                logger.debug('Thumbnail loaded for: %s', Path(video_path).name)
+                self.grid_canvas.itemconfigure(image_id, image=photo)
+                self.grid_canvas.itemconfigure(status_id, text='')
+                self._grid_images[image_id] = photo  # Keep reference to prevent garbage collection
             else:
-                # Thumbnail generation failed
-                self.parent.after(0, lambda: label.config(text='[No thumbnail]', foreground='white')
-                                          if label.winfo_exists() else None)
-                logger.warning('Failed to load thumbnail for: %s', video_path)
-        except (RuntimeError, ValueError) as e:
-            logger.error('Error in thumbnail callback: %s', e)
+                self.grid_canvas.itemconfigure(status_id, text='[No thumbnail]')
+        except tk.TclError as e:
+            logger.debug('Grid canvas no longer exists: %s', e)
+
+    def _get_cached_photo(self, key: str):
+        """Return a cached PhotoImage and mark it as recently used.
+        
+        Args:
+            key: video_path the image was decoded from
+            
+        Returns:
+            PhotoImage or None if not cached
+        """
+        photo = self._photo_cache.get(key)
+        if photo is not None:
+            self._photo_cache.move_to_end(key)
+        return photo
 
-    def _update_thumbnail_on_main_thread(self, label: tk.Label, photo):
-        """Update label with thumbnail image on the main thread.
+    def _cache_photo(self, key: str, photo):
+        """Store a PhotoImage in the LRU cache, evicting the oldest entries.
         
         Args:
-            label: tk.Label widget to update
-            photo: PhotoImage to display
+            key: video_path the image was decoded from
+            photo: PhotoImage to cache
+        """
+        self._photo_cache[key] = photo
+        self._photo_cache.move_to_end(key)
+        while len(self._photo_cache) > self.PHOTO_CACHE_SIZE:
+            self._photo_cache.popitem(last=False)
+
+    def _extract_timeline_frame(self, video_path: str, frame_index: int,
+                                timestamp: float) -> Tuple[Optional[str], Optional[Image.Image]]:
+        """Extract and decode one timeline frame. Runs on the timeline pool.
+        
+        Args:
+            video_path: Path to video file
+            frame_index: Frame index in the timeline
+            timestamp: Time position in seconds
+            
+        Returns:
+            Tuple of (frame path, decoded image), or (None, None) on failure
+        """
+        frame_path = ThumbnailGenerator.generate_single_timeline_frame(
+            video_path,
+            frame_index=frame_index,
+            timestamp=timestamp
+        )
+        if not frame_path:
+            return None, None
+        img = self._prepare_timeline_frame(frame_path)
+        return (frame_path, img) if img is not None else (None, None)
+
+    def _prepare_timeline_frame(self, frame_path: str) -> Optional[Image.Image]:
+        """Decode a timeline frame off the Tk thread.
+        
+        Args:
+            frame_path: Path to the frame image
+            
+        Returns:
+            Decoded image, or None if the frame can't be read
         """
         try:
-            # Check if widget still exists
-            if not label.winfo_exists():
-                logger.debug('Label widget no longer exists, skipping thumbnail update')
-                return
+            return self._decode_timeline_frame(frame_path)
+        except (OSError, ValueError) as e:
+            logger.warning("Error decoding timeline frame %s: %s", frame_path, e)
+            return None
 
-            label.config(image=photo, text='')
-            label.image = photo  # Keep reference to prevent garbage collection
-        except tk.TclError as e:
-            logger.debug('Label widget no longer exists: %s', e)
+    def _decode_timeline_frame(self, frame_path: str) -> Image.Image:
+        """Open and fully decode a timeline frame image. Safe to call off the Tk thread.
+        
+        Args:
+            frame_path: Path to the frame image
+            
+        Returns:
+            Decoded PIL image
+        """
+        img = Image.open(frame_path)
+        # Frames are PNGs that ffmpeg already scaled to the slot size, so this is a
+        # no-op for them; older cached frames may be larger and are shrunk here
+        img.thumbnail(self.TIMELINE_FRAME_SIZE, Image.Resampling.LANCZOS)
+        # PNG decoding is lazy: do it here on the worker, not in PhotoImage on the Tk thread
+        img.load()
+        return img
+
+    def _load_timeline_photo(self, frame_path: str, img: Optional[Image.Image] = None):
+        """Load a timeline frame as a PhotoImage.
+        
+        Args:
+            frame_path: Path to the frame image
+            img: Image already decoded by a worker, if any
+            
+        Returns:
+            PhotoImage for the frame
+        """
+        if img is None:
+            img = self._decode_timeline_frame(frame_path)
+        # Only the Tk image allocation happens on the UI thread
+        return ImageTk.PhotoImage(img)
+
+    def _remember_timeline_photo(self, video_id: int, frame_index: int, photo,
+                                 timestamp_str: str):
+        """Keep a decoded timeline frame in the per-video LRU, evicting the oldest videos.
+        
+        Args:
+            video_id: Video the frame belongs to
+            frame_index: Frame index in the timeline
+            photo: PhotoImage of the frame
+            timestamp_str: Timestamp text shown below the frame
+        """
+        if not video_id:
+            return
+        photos = self._timeline_photo_cache.setdefault(video_id, {})
+        self._timeline_photo_cache.move_to_end(video_id)
+        photos[frame_index] = (photo, timestamp_str)
+        while len(self._timeline_photo_cache) > self.TIMELINE_PHOTO_CACHE_SIZE:
+            # Dropping the last reference frees the Tk image right away
+            self._timeline_photo_cache.popitem(last=False)
 
     def update_categories(self, categories: List[str]):
         """Update available categories (called by app)."""
@@ -947,3 +1689,18 @@ class UIPreview:
         # Stop timeline generation
         if hasattr(self, 'timeline_stop_event'):
             self.timeline_stop_event.set()
+        if hasattr(self, '_timeline_pool'):
+            self._timeline_pool.shutdown(wait=False, cancel_futures=True)
+        # Write out a pending timeline cache update now
+        if getattr(self, '_cache_flush_timer', None) is not None:
+            self._cache_flush_timer.cancel()
+            self._flush_timeline_cache()
+        # Pending after() callbacks would otherwise fire on destroyed widgets
+        for after_id in list(getattr(self, '_after_ids', ())):
+            self._after_cancel(after_id)
+        self._resize_after_id = self._wheel_pending = self._timeline_poll_id = None
+        self._thumbnail_poll_id = None
+        # Drop the large containers so teardown doesn't wait on the widgets
+        self._video_data = []
+        self._video_by_id = {}
+        self.timeline_photos = {}
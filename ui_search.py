@@ -7,7 +7,10 @@ category, rating, notes, and other metadata.
 import tkinter as tk
 from tkinter import ttk
 import logging
-from typing import Callable, List, Dict, Any
+from collections import deque
+from functools import partial
+from typing import Callable, List, Dict, Any, Deque, Set
+from ui_utils import weak_cmd
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +18,12 @@ logger = logging.getLogger(__name__)
 class UISearch:
     """Search interface for finding and filtering videos."""
 
+    # Keys that don't change the search text
+    NAVIGATION_KEYS = frozenset({
+        'Up', 'Down', 'Left', 'Right', 'Home', 'End', 'Return', 'KP_Enter', 'Tab',
+        'Escape', 'Shift_L', 'Shift_R', 'Control_L', 'Control_R', 'Alt_L', 'Alt_R',
+    })
+
     def __init__(self, parent, on_search_results: Callable[[List[Dict[str, Any]]], None]):
         """Initialize search UI.
         
@@ -25,10 +34,18 @@ class UISearch:
         """
         self.parent = parent
         self.on_search_results = on_search_results
-        self.search_history: List[str] = []
         self.max_history = 10
+        # Most recent first; the set mirrors the deque for O(1) membership tests
+        self.search_history: Deque[str] = deque(maxlen=self.max_history)
+        self._history_set: Set[str] = set()
         self._search_timer = None
         self._on_search_params = None
+        # Last-known filter values, updated from widget events so a search
+        # doesn't round-trip through Tcl for every variable. The query text is
+        # always read from the entry: it can also change by paste or from code
+        self._cached: Dict[str, Any] = {
+            'category': 'All', 'min_rating': 0, 'mode': 'all'
+        }
 
         self._build_ui()
 
@@ -45,28 +62,31 @@ class UISearch:
         ttk.Label(input_frame, text='Search:').pack(side=tk.LEFT, padx=5)
 
         self.search_var = tk.StringVar()
-        self.search_var.trace('w', self._on_search_input)
 
         self.search_entry = ttk.Combobox(
             input_frame,
             textvariable=self.search_var,
             width=20,
-            values=self.search_history,
+            values=list(self.search_history),
             state='normal'
         )
         self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
-        self.search_entry.bind('<Return>', self._on_search_pressed)
+        self.search_entry.bind('<Return>', weak_cmd(self, UISearch._on_query_committed))
+        # Live search reads the entry text on key release (no StringVar trace per change)
+        self.search_entry.bind('<KeyRelease>', weak_cmd(self, UISearch._on_key_release))
+        self.search_entry.bind('<<ComboboxSelected>>',
+                               weak_cmd(self, UISearch._on_query_committed))
 
         ttk.Button(
             input_frame,
             text='🔍 Search',
-            command=self._perform_search
+            command=weak_cmd(self, UISearch._perform_search)
         ).pack(side=tk.LEFT, padx=5)
 
         ttk.Button(
             input_frame,
             text='✕ Clear',
-            command=self._clear_search
+            command=weak_cmd(self, UISearch._clear_search)
         ).pack(side=tk.LEFT, padx=5)
 
         # Filter options frame
@@ -88,7 +108,8 @@ class UISearch:
             width=12
         )
         self.category_combo.pack(side=tk.LEFT, padx=5)
-        self.category_combo.bind('<<ComboboxSelected>>', lambda e: self._perform_search())
+        self.category_combo.bind('<<ComboboxSelected>>',
+                                 weak_cmd(self, UISearch._on_category_selected))
 
         # Rating filter
         rating_frame = ttk.Frame(input_frame)
@@ -97,15 +118,19 @@ class UISearch:
         ttk.Label(input_frame, text='Min Rating:').pack(side=tk.LEFT, padx=5)
 
         self.rating_var = tk.IntVar(value=0)
-        self.rating_var.trace('w', lambda *_: self._perform_search())
+        # command runs after the arrows change the value (<<Increment>> and
+        # <<Decrement>> fire before it); typed values are read on Return/FocusOut
         self.rating_spin = ttk.Spinbox(
             input_frame,
             from_=0,
             to=5,
             textvariable=self.rating_var,
-            width=5
+            width=5,
+            command=weak_cmd(self, UISearch._on_rating_changed)
         )
         self.rating_spin.pack(side=tk.LEFT, padx=5)
+        self.rating_spin.bind('<Return>', weak_cmd(self, UISearch._on_rating_changed))
+        self.rating_spin.bind('<FocusOut>', weak_cmd(self, UISearch._on_rating_changed))
 
         # Search mode
         #mode_frame = ttk.Frame(filter_frame)
@@ -126,7 +151,7 @@ class UISearch:
                 text=text,
                 variable=self.search_mode_var,
                 value=value,
-                command=self._perform_search
+                command=partial(weak_cmd(self, UISearch._on_mode_selected), value)
             ).pack(side=tk.LEFT, padx=5)
 
         # Search results info
@@ -137,26 +162,54 @@ class UISearch:
         )
         self.info_label.pack(fill=tk.X, side='right', padx=5, pady=5)
 
-    def _on_search_input(self, *_):
+    def _on_key_release(self, event):
         """Live search as user types."""
+        if event.keysym in self.NAVIGATION_KEYS:
+            return
         # Only trigger on significant changes to avoid too many searches
-        search_text = self.search_var.get()
+        search_text = event.widget.get()
         if len(search_text) >= 2 or len(search_text) == 0:
             # Debounce with a timer
             if self._search_timer:
                 self.parent.after_cancel(self._search_timer)
-            self._search_timer = self.parent.after(300, self._perform_search)
+            self._search_timer = self.parent.after(300, self._run_debounced_search)
+
+    def _run_debounced_search(self):
+        """Run the search scheduled by _on_key_release."""
+        self._search_timer = None
+        self._perform_search()
+
+    def _on_query_committed(self, _event):
+        """Handle Enter or a history pick in the search entry."""
+        self._perform_search()
 
-    def _on_search_pressed(self, *_):
-        """Handle Enter key press."""
+    def _on_category_selected(self, event):
+        """Handle a category filter change."""
+        self._cached['category'] = event.widget.get()
+        self._perform_search()
+
+    def _on_rating_changed(self, *_):
+        """Handle a minimum rating change from the spinbox."""
+        try:
+            min_rating = int(self.rating_spin.get())
+        except ValueError:
+            min_rating = 0
+        if min_rating != self._cached['min_rating']:
+            self._cached['min_rating'] = min_rating
+            self._perform_search()
+
+    def _on_mode_selected(self, mode: str):
+        """Handle a search mode radio button."""
+        self._cached['mode'] = mode
         self._perform_search()
 
     def _perform_search(self):
         """Execute search with current filters."""
-        search_text = self.search_var.get().strip()
-        category = self.category_var.get()
-        min_rating = self.rating_var.get()
-        search_mode = self.search_mode_var.get()
+        cached = self._cached
+        search_text = self.search_entry.get().strip()
+        category = cached['category']
+        min_rating = cached['min_rating']
+        search_mode = cached['mode']
 
         # Build search parameters
         search_params = {
@@ -167,10 +220,13 @@ class UISearch:
         }
 
         # Add to search history
-        if search_text and search_text not in self.search_history:
-            self.search_history.insert(0, search_text)
-            self.search_history = self.search_history[:self.max_history]
-            self.search_entry['values'] = self.search_history
+        if search_text and search_text not in self._history_set:
+            if len(self.search_history) == self.max_history:
+                # appendleft will push the oldest entry out of the deque
+                self._history_set.discard(self.search_history[-1])
+            self.search_history.appendleft(search_text)
+            self._history_set.add(search_text)
+            self.search_entry['values'] = list(self.search_history)
             logger.info('Added to search history: %s', search_text)
 
         # Trigger callback with search parameters
@@ -187,10 +243,21 @@ class UISearch:
         self.category_var.set('All')
         self.rating_var.set(0)
         self.search_mode_var.set('all')
+        self._cached.update(category='All', min_rating=0, mode='all')
         self._perform_search()
         self.info_label.config(text='Search cleared - showing all videos')
         logger.info('Search cleared')
 
+    def cleanup(self):
+        """Cancel the pending debounced search before the widgets are destroyed."""
+        if self._search_timer:
+            try:
+                self.parent.after_cancel(self._search_timer)
+            except tk.TclError:
+                pass
+        self._search_timer = None
+        self._on_search_params = None
+
     def set_search_callback(self, callback):
         """Set the callback for search results.
         
@@ -0,0 +1,30 @@
+"""Shared Tkinter helpers for VideoManager UI modules."""
+
+import weakref
+from typing import Any, Callable
+
+
+def weak_cmd(obj: Any, method: Callable) -> Callable:
+    """Wrap an unbound method as a Tk callback holding only a weak reference to obj.
+    
+    A bound method passed as a command/bind/trace callback keeps its instance
+    alive through the widget (widget -> callback -> self -> widget). With this
+    wrapper the instance can be collected as soon as the UI is torn down, so no
+    manual unbinding is needed on cleanup.
+    
+    Args:
+        obj: Instance the method is called on
+        method: Unbound method, e.g. UISearch._perform_search
+        
+    Returns:
+        Callback calling method(obj, *args) while obj is alive, else doing nothing
+    """
+    ref = weakref.ref(obj)
+
+    def callback(*args, **kwargs):
+        target = ref()
+        if target is None:
+            return None
+        return method(target, *args, **kwargs)
+
+    return callback
@@ -1,32 +1,36 @@
 """Version management module for VideoManager application."""
 
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import json
+from dataclasses import dataclass, field
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True, order=True)
 class VersionInfo:
-    """Version information container."""
-
-    def __init__(self, major: int, minor: int, patch: int, pre_release: str = "", build: str = ""):
-        """Initialize version.
-        
-        Args:
-            major: Major version number
-            minor: Minor version number
-            patch: Patch version number
-            pre_release: Pre-release label (alpha, beta, rc, etc.)
-            build: Build metadata
-        """
-        self.major = major
-        self.minor = minor
-        self.patch = patch
-        self.pre_release = pre_release
-        self.build = build
+    """Version information container.
+    
+    Versions compare and hash by (major, minor, patch) only; the pre-release
+    label and build metadata are informational.
+    
+    Attributes:
+        major: Major version number
+        minor: Minor version number
+        patch: Patch version number
+        pre_release: Pre-release label (alpha, beta, rc, etc.)
+        build: Build metadata
+    """
+
+    major: int
+    minor: int
+    patch: int
+    pre_release: str = field(default="", compare=False)
+    build: str = field(default="", compare=False)
 
     def __str__(self) -> str:
         """Return version string."""
@@ -37,34 +41,6 @@ class VersionInfo:
             version += f"+{self.build}"
         return version
 
-    def __eq__(self, other) -> bool:
-        """Check equality."""
-        if not isinstance(other, VersionInfo):
-            return False
-        return (self.major == other.major and
-                self.minor == other.minor and
-                self.patch == other.patch)
-
-    def __lt__(self, other) -> bool:
-        """Check if less than."""
-        if not isinstance(other, VersionInfo):
-            return NotImplemented
-        return (self.major, self.minor, self.patch) < (other.major, other.minor, other.patch)
-
-    def __le__(self, other) -> bool:
-        """Check if less than or equal."""
-        return self < other or self == other
-
-    def __gt__(self, other) -> bool:
-        """Check if greater than."""
-        if not isinstance(other, VersionInfo):
-            return NotImplemented
-        return (self.major, self.minor, self.patch) > (other.major, other.minor, other.patch)
-
-    def __ge__(self, other) -> bool:
-        """Check if greater than or equal."""
-        return self > other or self == other
-
 
 class VersionManager:
     """Manage application and module versions."""
@@ -170,6 +146,45 @@ class VersionManager:
         """
         return VersionManager.DB_VERSION
 
+    # Stand-in for the timestamp in the pre-serialized version file
+    _SAVED_AT_MARKER = '"__saved_at__"'
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _version_json_parts() -> Tuple[str, str]:
+        """Serialize the constant part of the version file once.
+        
+        Returns:
+            JSON text before and after the saved_at value
+        """
+        version_info = {
+            'app_version': str(VersionManager.APP_VERSION),
+            'db_version': str(VersionManager.DB_VERSION),
+            'modules': {name: str(ver) for name, ver in VersionManager.MODULE_VERSIONS.items()},
+            'saved_at': json.loads(VersionManager._SAVED_AT_MARKER),
+            'changelog': VersionManager.CHANGELOG,
+        }
+        prefix, suffix = json.dumps(version_info, indent=2).split(
+            VersionManager._SAVED_AT_MARKER, 1)
+        return prefix, suffix
+
+    @staticmethod
+    def is_version_file_current() -> bool:
+        """Check whether the version file already holds the current versions.
+        
+        Only the saved_at timestamp may differ, so the file text is compared
+        against the pre-serialized parts without parsing it.
+        
+        Returns:
+            True if the file exists and matches, False otherwise
+        """
+        prefix, suffix = VersionManager._version_json_parts()
+        try:
+            text = VersionManager.get_version_file_path().read_text(encoding='utf-8')
+        except OSError:
+            return False
+        return text.startswith(prefix) and text.endswith(suffix)
+
     @staticmethod
     def save_version_info() -> bool:
         """Save version information to file.
@@ -178,17 +193,14 @@ class VersionManager:
             True if successful, False otherwise
         """
         try:
-            version_info = {
-                'app_version': str(VersionManager.APP_VERSION),
-                'db_version': str(VersionManager.DB_VERSION),
-                'modules': {name: str(ver) for name, ver in VersionManager.MODULE_VERSIONS.items()},
-                'saved_at': datetime.now().isoformat(),
-                'changelog': VersionManager.CHANGELOG,
-            }
+            # Only the timestamp changes between saves
+            prefix, suffix = VersionManager._version_json_parts()
+            saved_at = json.dumps(datetime.now().isoformat())
 
             version_file = VersionManager.get_version_file_path()
             with open(version_file, 'w', encoding='utf-8') as f:
-                json.dump(version_info, f, indent=2)
+                f.write(prefix + saved_at + suffix)
+            VersionManager.load_version_info.cache_clear()
 
             logger.info("Version information saved to %s", version_file)
             return True
@@ -197,9 +209,13 @@ class VersionManager:
             return False
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def load_version_info() -> Optional[Dict]:
         """Load version information from file.
         
+        Parsed once and cached until save_version_info rewrites the file; treat
+        the returned dict as read-only.
+        
         Returns:
             Dict with version information or None if file not found
         """
@@ -208,16 +224,18 @@ class VersionManager:
             if not version_file.exists():
                 return None
 
-            with open(version_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return json.loads(version_file.read_bytes())
         except (OSError, IOError, json.JSONDecodeError) as e:
             logger.error("Failed to load version information: %s", e)
             return None
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_version_string() -> str:
         """Get formatted version string for display.
         
+        Built once; versions are class constants.
+        
         Returns:
             Formatted version string
         """
@@ -242,19 +260,23 @@ class VersionManager:
 
     @staticmethod
     def log_version_info() -> None:
-        """Log version information to logger."""
-        logger.info("=" * 60)
-        logger.info("VideoManager - Version Information")
-        logger.info("=" * 60)
-        logger.info("Application Version: %s", VersionManager.APP_VERSION)
-        logger.info("Database Version: %s", VersionManager.DB_VERSION)
-        logger.info("-" * 60)
-        logger.info("Module Versions:")
-
-        for module_name, version in sorted(VersionManager.MODULE_VERSIONS.items()):
-            logger.info("  • %s: %s", module_name, version)
+        """Log version information to logger as a single record."""
+        logger.info("\n%s", VersionManager.get_version_string())
 
-        logger.info("=" * 60)
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _version_checks() -> Tuple[Tuple[Tuple[str, VersionInfo], ...], bool]:
+        """Resolve the compatibility checks once; the versions are class constants.
+        
+        Returns:
+            Tuple of (outdated (module name, version) pairs, database incompatible)
+        """
+        app_major = VersionManager.APP_VERSION.major
+        outdated = tuple(
+            (name, ver) for name, ver in VersionManager.MODULE_VERSIONS.items()
+            if ver.major < app_major
+        )
+        return outdated, VersionManager.DB_VERSION.major < app_major
 
     @staticmethod
     def check_compatibility() -> Dict[str, bool]:
@@ -269,17 +291,16 @@ class VersionManager:
             'errors': [],
         }
 
-        # Check if any module version is significantly outdated
-        app_major = VersionManager.APP_VERSION.major
+        outdated, db_incompatible = VersionManager._version_checks()
 
-        for module_name, module_ver in VersionManager.MODULE_VERSIONS.items():
-            if module_ver.major < app_major:
-                warning = f"Module '{module_name}' version {module_ver} is outdated (app is {VersionManager.APP_VERSION})"
-                compatibility['warnings'].append(warning)
-                logger.warning(warning)
+        # Check if any module version is significantly outdated
+        for module_name, module_ver in outdated:
+            warning = f"Module '{module_name}' version {module_ver} is outdated (app is {VersionManager.APP_VERSION})"
+            compatibility['warnings'].append(warning)
+            logger.warning(warning)
 
         # Check database compatibility
-        if VersionManager.DB_VERSION.major < VersionManager.APP_VERSION.major:
+        if db_incompatible:
             error = f"Database version {VersionManager.DB_VERSION} is incompatible with app {VersionManager.APP_VERSION}"
             compatibility['errors'].append(error)
             compatibility['all_compatible'] = False
@@ -291,9 +312,12 @@ class VersionManager:
         return compatibility
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_feature_list() -> str:
         """Get formatted feature list.
         
+        Built once; the changelog is a class constant.
+        
         Returns:
             Formatted feature list string
         """
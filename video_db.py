@@ -5,24 +5,107 @@ Manages video metadata storage, retrieval, and updates.
 
 import sqlite3
 import os
-from typing import List, Dict, Any, Optional
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Iterator, FrozenSet
 from thumbnail_generator import ThumbnailGenerator
 
+logger = logging.getLogger(__name__)
+
 
 class VideoDatabase:
     """ Video metadata database handler."""
     SUPPORTED_FORMATS = {'.mp4', '.mkv', '.avi', '.mov', '.flv', '.wmv', '.webm'}
 
+    # Stored in PRAGMA user_version once the schema below has been created:
+    # 1 = videos table and indexes, 2 = FTS5 search index
+    SCHEMA_VERSION = 2
+
+    # Secondary indexes: (name, column)
+    INDEXES = (
+        ('idx_videos_filename', 'filename'),  # check_duplicate_video
+        ('idx_videos_category', 'category'),
+        ('idx_videos_rating', 'rating'),
+    )
+
+    # ffprobe runs are subprocess/IO bound, so threads are enough to overlap them
+    PROBE_WORKERS = (os.cpu_count() or 2) * 2
+
+    # Columns returned for a video; the thumbnail BLOB is fetched by get_thumbnail
+    VIDEO_COLUMNS = 'id, filename, path, title, duration, category, rating, notes, added_date'
+
+    # Columns matched by the search text in each search mode
+    SEARCH_MODE_COLUMNS = {
+        'title_filename': ('title', 'filename'),
+        'filename': ('filename',),
+        'title': ('title',),
+        'notes': ('notes',),
+        'all': ('title', 'filename', 'notes', 'category'),
+    }
+
+    # Imports at least this large are inserted with the indexes dropped (bulk_import)
+    BULK_IMPORT_THRESHOLD = 1000
+
+    # Rows probed and inserted per transaction during an import
+    IMPORT_BATCH_SIZE = 500
+
+    # Seconds between checks of an import's stop event while probes are running
+    PROBE_STOP_CHECK_INTERVAL = 0.2
+
+    # Rows kept by get_video for repeated selections of the same videos
+    VIDEO_CACHE_SIZE = 256
+
     def __init__(self, db_path: str = 'videos.db'):
         self.db_path = db_path
         self.conn = None
+        self._has_fts = False
+        # One connection shared by the UI and import threads; every statement and
+        # transaction runs under this lock. Nothing takes it twice: bulk_import
+        # releases it while the batches are inserted
+        self._lock = threading.Lock()
+        # get_video rows by id, least recently used first; dropped on update/delete
+        self._video_cache: 'OrderedDict[int, sqlite3.Row]' = OrderedDict()
         self.init_db()
 
     def init_db(self):
         """Initialize database with required tables."""
-        self.conn = sqlite3.connect(self.db_path)
+        # Autocommit: single statements commit on their own and batches use an
+        # explicit BEGIN. The connection is also used from worker threads
+        # Larger statement cache so searches don't evict the INSERT/UPDATE statements
+        self.conn = sqlite3.connect(self.db_path, isolation_level=None,
+                                    check_same_thread=False, cached_statements=512)
+        # Rows are addressable by column name and dict(row) is built in C
+        self.conn.row_factory = sqlite3.Row
         cursor = self.conn.cursor()
+        # Reused by add_video instead of allocating a cursor per insert
+        self._insert_cursor = self.conn.cursor()
+
+        # WAL with synchronous=NORMAL makes each commit a cheap append instead of an
+        # fsync'd rollback journal, and lets readers run while a write is in progress
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA cache_size=-65536')  # 64 MB
+        cursor.execute('PRAGMA mmap_size=268435456')  # 256 MB
+
+        # Schema is up to date: skip the DDL (and its schema lock) on every start
+        version = cursor.execute('PRAGMA user_version').fetchone()[0]
+        if version >= self.SCHEMA_VERSION:
+            # The FTS table is missing if the schema was created by an SQLite
+            # without FTS5; searches then use LIKE scans
+            self._has_fts = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'videos_fts'"
+            ).fetchone() is not None
+            # An import interrupted inside bulk_import leaves its indexes dropped;
+            # IF NOT EXISTS makes this a catalog lookup when they are present
+            self._create_indexes()
+            return
 
+        cursor.execute('BEGIN')
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS videos (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -37,9 +120,178 @@ class VideoDatabase:
                 added_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         ''')
+        self._create_indexes()
+
+        try:
+            self._create_fts(cursor)
+            self._has_fts = True
+        except sqlite3.OperationalError as e:
+            # SQLite built without FTS5: search keeps using LIKE scans
+            logger.warning('Full-text search unavailable, using LIKE search: %s', e)
+            self._has_fts = False
+        # Stamped either way, so the DDL isn't run (and FTS retried) on every start
+        cursor.execute(f'PRAGMA user_version={self.SCHEMA_VERSION}')
 
         self.conn.commit()
 
+    @staticmethod
+    def _create_fts(cursor: sqlite3.Cursor):
+        """Create the FTS5 index over the searchable columns and keep it in sync.
+        
+        The index is external-content (the text lives only in videos); triggers
+        mirror every insert, delete and text update into it.
+        
+        Args:
+            cursor: Cursor inside the schema transaction
+        """
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS videos_fts USING fts5(
+                title, filename, notes, category,
+                content='videos', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS videos_fts_ai AFTER INSERT ON videos BEGIN
+                INSERT INTO videos_fts(rowid, title, filename, notes, category)
+                VALUES (new.id, new.title, new.filename, new.notes, new.category);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS videos_fts_ad AFTER DELETE ON videos BEGIN
+                INSERT INTO videos_fts(videos_fts, rowid, title, filename, notes, category)
+                VALUES ('delete', old.id, old.title, old.filename, old.notes, old.category);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS videos_fts_au
+            AFTER UPDATE OF title, filename, notes, category ON videos BEGIN
+                INSERT INTO videos_fts(videos_fts, rowid, title, filename, notes, category)
+                VALUES ('delete', old.id, old.title, old.filename, old.notes, old.category);
+                INSERT INTO videos_fts(rowid, title, filename, notes, category)
+                VALUES (new.id, new.title, new.filename, new.notes, new.category);
+            END
+        ''')
+        # Index the rows that existed before the FTS table
+        cursor.execute("INSERT INTO videos_fts(videos_fts) VALUES ('rebuild')")
+
+    def _create_indexes(self):
+        """Create the secondary indexes if they don't exist."""
+        for name, column in self.INDEXES:
+            self.conn.execute(f'CREATE INDEX IF NOT EXISTS {name} ON videos({column})')
+
+    @contextmanager
+    def bulk_import(self) -> Iterator[None]:
+        """Drop the secondary indexes for a large import and rebuild them afterwards.
+        
+        Building an index once over the final table is cheaper than updating it
+        for every inserted row.
+        """
+        with self._lock:
+            for name, _ in self.INDEXES:
+                self.conn.execute(f'DROP INDEX IF EXISTS {name}')
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._create_indexes()
+
+    @staticmethod
+    def build_video_row(filepath: str, category: str = 'public',
+                        tags: str = '', duration: Optional[str] = None,
+                        title: Optional[str] = None) -> Tuple[str, str, str, str, str, str]:
+        """Build the INSERT values for a video file.
+        
+        Args:
+            filepath: Full path to video file
+            category: Video category (public, private, ticket, password, clip, special)
+            tags: Space-separated tags
+            duration: Video duration (auto-detected if None)
+            title: Display title (filename if None)
+        
+        Returns:
+            Tuple of (filename, path, title, duration, category, notes)
+        """
+        filename = os.path.basename(filepath)
+        if title is None:
+            title = os.path.splitext(filename)[0]
+
+        # Auto-detect duration if not provided ('' is an already probed, unknown one)
+        if duration is None:
+            duration = VideoDatabase._probe_duration(filepath)
+
+        return (filename, filepath, title, duration or '', category, tags)
+
+    def build_video_rows(self, filepaths: List[str],
+                         stop_event: Optional[threading.Event] = None
+                         ) -> List[Tuple[str, str, str, str, str, str]]:
+        """Build the INSERT values for many video files, probing durations in parallel.
+        
+        Args:
+            filepaths: Full paths to video files
+            stop_event: When set, probing stops and only the files probed so far
+                are returned
+        
+        Returns:
+            List of tuples as returned by build_video_row, in input order
+        """
+        durations = self._probe_durations(filepaths, stop_event)
+        return [self.build_video_row(path, duration=durations[path])
+                for path in filepaths if path in durations]
+
+    @staticmethod
+    def _probe_duration(filepath: str) -> str:
+        """Detect a video's duration with ffprobe.
+        
+        Args:
+            filepath: Full path to video file
+        
+        Returns:
+            Duration as 'M:SS', or '' if unknown
+        """
+        try:
+            duration_sec = ThumbnailGenerator.get_video_duration(filepath)
+        except (OSError, ValueError, TypeError):
+            return ''
+        if duration_sec and duration_sec > 0:
+            minutes = int(duration_sec // 60)
+            seconds = int(duration_sec % 60)
+            return f"{minutes}:{seconds:02d}"
+        return ''
+
+    def _probe_durations(self, filepaths: List[str],
+                         stop_event: Optional[threading.Event] = None) -> Dict[str, str]:
+        """Detect the durations of many videos concurrently.
+        
+        Args:
+            filepaths: Full paths to video files
+            stop_event: When set, queued probes are cancelled and running ones
+                are left to finish in the background
+        
+        Returns:
+            Dict mapping each probed path to its duration ('' if unknown)
+        """
+        if not filepaths:
+            return {}
+        workers = min(self.PROBE_WORKERS, len(filepaths))
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='DurationProbe')
+        futures = {pool.submit(self._probe_duration, path): path for path in filepaths}
+        durations = {}
+        pending = set(futures)
+        try:
+            while pending:
+                if stop_event is not None and stop_event.is_set():
+                    logger.info('Duration probing stopped with %d files left', len(pending))
+                    break
+                done, pending = wait(pending, timeout=self.PROBE_STOP_CHECK_INTERVAL,
+                                     return_when=FIRST_COMPLETED)
+                for future in done:
+                    durations[futures[future]] = future.result()
+        finally:
+            # Don't wait for a probe (up to its ffprobe timeout) once stopped
+            pool.shutdown(wait=False, cancel_futures=True)
+        return durations
+
     def add_video(self, filepath: str, category: str = 'public',
                   tags: str = '', duration: Optional[str] = None,
                   title: Optional[str] = None) -> Optional[int]:
@@ -58,33 +310,48 @@ class VideoDatabase:
         if not os.path.exists(filepath):
             return None
 
-        filename = os.path.basename(filepath)
-        if title is None:
-            title = os.path.splitext(filename)[0]
+        row = self.build_video_row(filepath, category, tags, duration, title)
 
-        # Auto-detect duration if not provided
-        if duration is None or duration == '':
+        cursor = self._insert_cursor
+        with self._lock:
             try:
-                duration_sec = ThumbnailGenerator.get_video_duration(filepath)
-                if duration_sec and duration_sec > 0:
-                    minutes = int(duration_sec // 60)
-                    seconds = int(duration_sec % 60)
-                    duration = f"{minutes}:{seconds:02d}"
-                else:
-                    duration = ''
-            except (OSError, ValueError, TypeError):
-                duration = ''
+                cursor.execute('''
+                    INSERT INTO videos (filename, path, title, duration, category, notes)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', row)
+                self.conn.commit()
+                return cursor.lastrowid
+            except sqlite3.IntegrityError:
+                return None
 
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute('''
-                INSERT INTO videos (filename, path, title, duration, category, notes)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (filename, filepath, title, duration or '', category, tags))
+    def add_videos_bulk(self, rows: List[Tuple[str, str, str, str, str, str]]) -> int:
+        """Insert many videos in a single transaction.
+        
+        Paths already in the database are skipped by the UNIQUE(path) constraint
+        without aborting the batch.
+        
+        Args:
+            rows: Tuples built by build_video_row
+        
+        Returns:
+            Number of videos inserted
+        """
+        if not rows:
+            return 0
+
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute('BEGIN')
+            try:
+                cursor.executemany('''
+                    INSERT OR IGNORE INTO videos (filename, path, title, duration, category, notes)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', rows)
+            except sqlite3.Error:
+                self.conn.rollback()
+                raise
             self.conn.commit()
-            return cursor.lastrowid
-        except sqlite3.IntegrityError:
-            return None
+            return cursor.rowcount
 
     def check_duplicate_video(self, filepath: str) -> Optional[Dict[str, Any]]:
         """Check if a video with the same name and extension already exists.
@@ -95,39 +362,107 @@ class VideoDatabase:
         Returns:
             Dictionary with existing video info if found, None otherwise
         """
-        if not os.path.exists(filepath):
-            return None
-        
         filename = os.path.basename(filepath)
         
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT * FROM videos WHERE filename = ?
-        ''', (filename,))
+        with self._lock:
+            result = self.conn.execute(f'''
+                SELECT {self.VIDEO_COLUMNS} FROM videos WHERE filename = ?
+            ''', (filename,)).fetchone()
         
-        result = cursor.fetchone()
         if result:
-            return self._row_to_dict(result, cursor)
+            return dict(result)
         
         return None
 
+    def count_videos(self) -> int:
+        """Return the number of videos in the database."""
+        with self._lock:
+            return self.conn.execute('SELECT COUNT(*) FROM videos').fetchone()[0]
+
+    def get_existing_paths(self) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """Fetch every stored path and filename in one query.
+        
+        Lets a folder import test duplicates in memory instead of running
+        check_duplicate_video once per file.
+        
+        Returns:
+            Tuple of (paths, filenames)
+        """
+        with self._lock:
+            rows = self.conn.execute('SELECT path, filename FROM videos').fetchall()
+        return frozenset(row[0] for row in rows), frozenset(row[1] for row in rows)
+
     def get_all_videos(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
         """Retrieve all videos (optionally filtered by category)."""
-        cursor = self.conn.cursor()
-        if category:
-            cursor.execute('SELECT * FROM videos WHERE category = ?', (category,))
-        else:
-            cursor.execute('SELECT * FROM videos ORDER BY added_date DESC')
+        with self._lock:
+            cursor = self.conn.cursor()
+            if category:
+                cursor.execute(f'SELECT {self.VIDEO_COLUMNS} FROM videos WHERE category = ?',
+                               (category,))
+            else:
+                cursor.execute(f'SELECT {self.VIDEO_COLUMNS} FROM videos ORDER BY added_date DESC')
+            # Rows are converted as they are stepped, without a fetchall() list
+            return [dict(row) for row in cursor]
 
-        rows = cursor.fetchall()
-        return [self._row_to_dict(row, cursor) for row in rows]
+    def get_videos_page(self, limit: int,
+                        after: Optional[Tuple[str, int]] = None) -> List[Dict[str, Any]]:
+        """Retrieve one page of videos, newest first.
+        
+        Pages continue from the sort key of the previous page's last video, so
+        no rows are skipped or repeated and no OFFSET rows are re-read.
+        
+        Args:
+            limit: Maximum number of videos to return
+            after: (added_date, id) of the previous page's last video, or None
+                for the first page
+        
+        Returns:
+            List of video dictionaries; fewer than limit on the last page
+        """
+        with self._lock:
+            if after is None:
+                cursor = self.conn.execute(
+                    f'SELECT {self.VIDEO_COLUMNS} FROM videos '
+                    'ORDER BY added_date DESC, id DESC LIMIT ?', (limit,))
+            else:
+                cursor = self.conn.execute(
+                    f'SELECT {self.VIDEO_COLUMNS} FROM videos WHERE (added_date, id) < (?, ?) '
+                    'ORDER BY added_date DESC, id DESC LIMIT ?', (*after, limit))
+            return [dict(row) for row in cursor]
 
     def get_video(self, video_id: int) -> Optional[Dict[str, Any]]:
-        """Retrieve a single video by ID."""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM videos WHERE id = ?', (video_id,))
-        row = cursor.fetchone()
-        return self._row_to_dict(row, cursor) if row else None
+        """Retrieve a single video by ID.
+        
+        Rows are cached per id until the video is updated or deleted; each call
+        returns a fresh dict, so callers may modify it.
+        """
+        with self._lock:
+            row = self._video_cache.get(video_id)
+            if row is not None:
+                self._video_cache.move_to_end(video_id)
+            else:
+                row = self.conn.execute(f'SELECT {self.VIDEO_COLUMNS} FROM videos WHERE id = ?',
+                                        (video_id,)).fetchone()
+                if row is None:
+                    return None
+                self._video_cache[video_id] = row
+                if len(self._video_cache) > self.VIDEO_CACHE_SIZE:
+                    self._video_cache.popitem(last=False)
+        return dict(row)
+
+    def get_thumbnail(self, video_id: int) -> Optional[bytes]:
+        """Retrieve a video's stored thumbnail image.
+        
+        Args:
+            video_id: Database video ID
+        
+        Returns:
+            Thumbnail bytes, or None if there is none
+        """
+        with self._lock:
+            row = self.conn.execute('SELECT thumbnail FROM videos WHERE id = ?',
+                                    (video_id,)).fetchone()
+        return row[0] if row else None
 
     def update_video(self, video_id: int, **kwargs) -> bool:
         """Update video metadata.
@@ -143,17 +478,21 @@ class VideoDatabase:
         set_clause = ', '.join([f'{k} = ?' for k in updates.keys()])
         values = list(updates.values()) + [video_id]
 
-        cursor = self.conn.cursor()
-        cursor.execute(f'UPDATE videos SET {set_clause} WHERE id = ?', values)
-        self.conn.commit()
-        return cursor.rowcount > 0
+        with self._lock:
+            self._video_cache.pop(video_id, None)
+            cursor = self.conn.cursor()
+            cursor.execute(f'UPDATE videos SET {set_clause} WHERE id = ?', values)
+            self.conn.commit()
+            return cursor.rowcount > 0
 
     def delete_video(self, video_id: int) -> bool:
         """Delete a video from the database."""
-        cursor = self.conn.cursor()
-        cursor.execute('DELETE FROM videos WHERE id = ?', (video_id,))
-        self.conn.commit()
-        return cursor.rowcount > 0
+        with self._lock:
+            self._video_cache.pop(video_id, None)
+            cursor = self.conn.cursor()
+            cursor.execute('DELETE FROM videos WHERE id = ?', (video_id,))
+            self.conn.commit()
+            return cursor.rowcount > 0
 
     def search_videos(self, query: str = '', category: Optional[str] = None,
                      min_rating: int = 0, search_mode: str = 'all') -> List[Dict[str, Any]]:
@@ -168,56 +507,78 @@ class VideoDatabase:
         Returns:
             List of matching video dictionaries
         """
-        cursor = self.conn.cursor()
-        
-        # Build query based on search mode
-        where_conditions = []
-        params = []
-        
-        if query:
-            query_param = f'%{query}%'
-            
-            if search_mode == 'title_filename':
-                where_conditions.append('(title LIKE ? OR filename LIKE ?)')
-                params.extend([query_param, query_param])
-            elif search_mode == 'filename':
-                where_conditions.append('filename LIKE ?')
-                params.append(query_param)
-            elif search_mode == 'title':
-                where_conditions.append('title LIKE ?')
-                params.append(query_param)
-            elif search_mode == 'notes':
-                where_conditions.append('notes LIKE ?')
-                params.append(query_param)
-            elif search_mode == 'all':
-                where_conditions.append('(title LIKE ? OR filename LIKE ? OR notes LIKE ? OR category LIKE ?)')
-                params.extend([query_param, query_param, query_param, query_param])
-        
-        # Add category filter
+        query_columns = self.SEARCH_MODE_COLUMNS.get(search_mode, ()) if query else ()
+        filter_params = []
         if category:
-            where_conditions.append('category = ?')
-            params.append(category)
-        
-        # Add rating filter
+            filter_params.append(category)
         if min_rating > 0:
-            where_conditions.append('rating >= ?')
-            params.append(min_rating)
+            filter_params.append(min_rating)
+
+        # Word-prefix lookups in the FTS index; LIKE substring scan as fallback
+        if query_columns and self._has_fts:
+            sql = self._search_sql(query_columns, bool(category), min_rating > 0, True)
+            params = [self._fts_match_expression(query, query_columns)] + filter_params
+            try:
+                with self._lock:
+                    return [dict(row) for row in self.conn.execute(sql, params)]
+            except sqlite3.OperationalError as e:
+                logger.debug('FTS query failed for %r, using LIKE: %s', query, e)
+
+        sql = self._search_sql(query_columns, bool(category), min_rating > 0)
+        params = [f'%{query}%'] * len(query_columns) + filter_params
+        with self._lock:
+            return [dict(row) for row in self.conn.execute(sql, params)]
+
+    @staticmethod
+    def _fts_match_expression(query: str, columns: Tuple[str, ...]) -> str:
+        """Build an FTS5 MATCH expression requiring every word as a prefix.
         
-        # Build final query
-        where_clause = ' AND '.join(where_conditions) if where_conditions else '1=1'
-        sql = f'SELECT * FROM videos WHERE {where_clause} ORDER BY title ASC'
+        Args:
+            query: Search text
+            columns: Columns the words must appear in
+        
+        Returns:
+            Expression like '{title filename} : ("foo"* "bar"*)'
+        """
+        terms = ' '.join('"' + word.replace('"', '""') + '"*' for word in query.split())
+        return '{' + ' '.join(columns) + '} : (' + terms + ')'
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _search_sql(query_columns: Tuple[str, ...], has_category: bool,
+                    has_rating: bool, fts: bool = False) -> str:
+        """Build the search statement for a combination of filters.
         
-        cursor.execute(sql, params)
-        results = cursor.fetchall()
+        The text is identical for the same filters, so sqlite3's statement cache
+        reuses the prepared statement instead of parsing it on every keystroke.
         
-        return [self._row_to_dict(row, cursor) for row in results]
+        Args:
+            query_columns: Columns matched against the search text
+            has_category: Filter on category
+            has_rating: Filter on minimum rating
+            fts: Match the text through videos_fts (one parameter) instead of LIKE
+        
+        Returns:
+            SQL with ? placeholders in the order: query, category, rating
+        """
+        where_conditions = []
+        if query_columns and fts:
+            where_conditions.append(
+                'id IN (SELECT rowid FROM videos_fts WHERE videos_fts MATCH ?)')
+        elif query_columns:
+            where_conditions.append(
+                '(' + ' OR '.join(f'{col} LIKE ?' for col in query_columns) + ')')
+        if has_category:
+            where_conditions.append('category = ?')
+        if has_rating:
+            where_conditions.append('rating >= ?')
 
-    def _row_to_dict(self, row: tuple, cursor) -> Dict[str, Any]:
-        """Convert database row to dictionary."""
-        cols = [description[0] for description in cursor.description]
-        return dict(zip(cols, row))
+        where_clause = ' AND '.join(where_conditions) if where_conditions else '1=1'
+        return (f'SELECT {VideoDatabase.VIDEO_COLUMNS} FROM videos '
+                f'WHERE {where_clause} ORDER BY title ASC')
 
     def close(self):
         """Close database connection."""
         if self.conn:
-            self.conn.close()
+            with self._lock:
+                self.conn.close()
@@ -18,13 +18,14 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import logging
 import os
-from pathlib import Path
-from typing import Dict, Any, List
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Iterator, Callable, Tuple, Optional
 
 from video_db import VideoDatabase
 from ui_preview import UIPreview
 from ui_edit import UIEdit
-from ui_player import UIPlayer
 from ui_search import UISearch
 from version import VersionManager
 
@@ -39,7 +40,28 @@ logger = logging.getLogger(__name__)
 class VideoManagerApp:
     """Main application window for video management."""
 
-    SUPPORTED_FORMATS = {'.mp4', '.mkv', '.avi', '.mov', '.flv', '.wmv', '.webm'}
+    SUPPORTED_FORMATS = ('.mp4', '.mkv', '.avi', '.mov', '.flv', '.wmv', '.webm')
+
+    # File dialog filter, built once in a stable order
+    _FILETYPES = (
+        ('Video files', ' '.join(f'*{fmt}' for fmt in SUPPORTED_FORMATS)),
+        ('All files', '*.*'),
+    )
+
+    # Interval (ms) for applying finished background jobs on the UI thread
+    BACKGROUND_POLL_MS = 50
+
+    # How long (ms) a status bar message stays visible
+    STATUS_CLEAR_MS = 5000
+
+    # Videos fetched per query by load_videos
+    LOAD_PAGE_SIZE = 500
+
+    # Fields UIEdit.load_video shows; preview rows normally carry all of them
+    EDITOR_FIELDS = frozenset({'title', 'path', 'category', 'rating', 'notes'})
+
+    # Window (ms) in which successive search results collapse into one grid rebuild
+    SEARCH_RESULTS_DELAY_MS = 100
 
     def __init__(self, root):
         """Initialize the application.
@@ -50,7 +72,8 @@ class VideoManagerApp:
         # Log version information on startup
         VersionManager.log_version_info()
         VersionManager.check_compatibility()
-        VersionManager.save_version_info()
+        if not VersionManager.is_version_file_current():
+            VersionManager.save_version_info()
 
         self.root = root
         self.root.title('VideoManager - Video Organizer')
@@ -65,6 +88,30 @@ class VideoManagerApp:
         # Initialize database
         self.db = VideoDatabase('videos.db')
 
+        # Imports (ffprobe + inserts) run off the Tk thread; a single worker keeps
+        # database writes in order. Finished jobs are applied by _poll_background
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='VideoImport')
+        # Full reloads get their own worker so a Refresh doesn't wait behind an import
+        self._read_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='VideoLoad')
+        # File existence checks for the selected video; kept apart so a selection
+        # doesn't wait behind a page load, and a slow share doesn't delay reloads
+        self._stat_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='VideoStat')
+        # Set on close; a running import stops probing and inserts what it has
+        self._closing = threading.Event()
+        self._done_queue: queue.Queue = queue.Queue()
+        self._pending_jobs = 0
+        self._poll_id = None
+        self._status_clear_id = None
+        self._pending_search_after = None
+        # Bumped by every load_videos and search; pages of older loads are dropped
+        self._load_generation = 0
+        # (done, total) posted by the import worker; shown by _poll_background
+        self._import_progress: Optional[Tuple[int, int]] = None
+        # Total number of videos for the search info label; None until known again
+        self._total_count: Optional[int] = None
+        # Parameters of the search on screen; None while the full list is shown
+        self._search_params: Optional[Dict[str, Any]] = None
+
         # Create main layout: LEFT (70%) | RIGHT (30%) | BOTTOM
         self._build_ui()
 
@@ -113,20 +160,45 @@ class VideoManagerApp:
         self.editor = UIEdit(right_frame, self._on_video_save)
 
         # BOTTOM: Player
-        bottom_frame = ttk.LabelFrame(self.root, text=' ', padding=5)
-        bottom_frame.pack(fill=tk.X, padx=5, pady=5)
+        self._bottom_frame = ttk.LabelFrame(self.root, text=' ', padding=5)
+        self._bottom_frame.pack(fill=tk.X, padx=5, pady=5)
+        # Built on first use; loading libVLC dominates startup otherwise
+        self._player = None
+
+        # Status bar for non-blocking notifications
+        self.status = ttk.Label(self.root, anchor='w')
+        self.status.pack(side=tk.BOTTOM, fill=tk.X, padx=5)
+
+    @property
+    def player(self):
+        """The VLC player panel, created the first time it is needed."""
+        if self._player is None:
+            # Imported here so python-vlc and libVLC are only loaded on demand
+            from ui_player import UIPlayer
+            self._player = UIPlayer(self._bottom_frame)
+        return self._player
+
+    def _show_status(self, text: str):
+        """Show a message in the status bar and clear it after STATUS_CLEAR_MS.
+        
+        Args:
+            text: Message to show
+        """
+        self.status.config(text=text)
+        if self._status_clear_id is not None:
+            self.root.after_cancel(self._status_clear_id)
+        self._status_clear_id = self.root.after(self.STATUS_CLEAR_MS, self._clear_status)
 
-        self.player = UIPlayer(bottom_frame)
+    def _clear_status(self):
+        """Clear the status bar message."""
+        self._status_clear_id = None
+        self.status.config(text='')
 
     def add_video(self):
         """Add a single video file."""
-        filetypes = [
-            ('Video files', ' '.join(f'*{fmt}' for fmt in self.SUPPORTED_FORMATS)),
-            ('All files', '*.*'),
-        ]
         filepath = filedialog.askopenfilename(
             title='Select a video file',
-            filetypes=filetypes
+            filetypes=self._FILETYPES
         )
 
         if filepath:
@@ -144,14 +216,28 @@ class VideoManagerApp:
                 if not result:
                     return
 
-            video_id = self.db.add_video(filepath)
-            if video_id:
-                logger.info('Added video: %s', filepath)
-                self.load_videos()
-                messagebox.askokcancel('Success',
-                                    f'Video added successfully (ID: {video_id})')
+            # Duration probing can take a while; keep the UI responsive
+            self._run_in_background(lambda: self.db.add_video(filepath),
+                                    lambda video_id: self._on_video_added(filepath, video_id))
+
+    def _on_video_added(self, filepath: str, video_id):
+        """Report the result of add_video. Called from UI thread."""
+        if video_id:
+            self._total_count = None
+            logger.info('Added video: %s', filepath)
+            if self._search_params is not None:
+                # The new video may not match; let the search decide what is shown
+                self._perform_search(self._search_params)
             else:
-                messagebox.showerror('Error', 'Video already exists or could not be added')
+                # Fetch and show just the new row; Refresh still reloads everything
+                video = self.db.get_video(video_id)
+                if video:
+                    self.preview.append_video(video)
+                self._total_count = self.db.count_videos()
+                self.search.update_info(self._total_count, self._total_count)
+            self._show_status(f'Video added successfully (ID: {video_id})')
+        else:
+            messagebox.showerror('Error', 'Video already exists or could not be added')
 
 
     def add_folder(self):
@@ -159,48 +245,220 @@ class VideoManagerApp:
         folder = filedialog.askdirectory(title='Select a folder with videos')
 
         if folder:
-            video_files = []
-            for fmt in self.SUPPORTED_FORMATS:
-                video_files.extend(Path(folder).rglob(f'*{fmt}'))
-                video_files.extend(Path(folder).rglob(f'*{fmt.upper()}'))
-
-            added = 0
-            skipped = 0
-            for filepath in video_files:
-                # Check for duplicates
-                duplicate = self.db.check_duplicate_video(str(filepath))
-                if duplicate:
-                    skipped += 1
-                    logger.info('Skipped duplicate: %s', filepath)
-                    continue
-
-                video_id = self.db.add_video(str(filepath))
-                if video_id:
-                    added += 1
-
-            self.load_videos()
-            message = f'Added {added} videos from the folder'
-            if skipped > 0:
-                message += f'\nSkipped {skipped} duplicate videos'
-            messagebox.askokcancel('Success', message)
-            logger.info('Added %d videos from %s (skipped %d duplicates)', added, folder, skipped)
+            # The directory walk can be slow (large or network trees): scan on the
+            # import worker together with the inserts
+            self._run_in_background(
+                lambda: self._scan_and_import(folder),
+                lambda result: self._on_folder_added(folder, *result)
+            )
+
+    def _scan_and_import(self, folder: str) -> Tuple[int, int]:
+        """Scan folder for new videos and import them. Runs on the import worker.
+        
+        Args:
+            folder: Root folder to scan recursively
+            
+        Returns:
+            Tuple of (videos added, duplicates skipped)
+        """
+        # One query for every known path/filename instead of one per scanned file
+        existing_paths, existing_names = self.db.get_existing_paths()
+        seen_names = set(existing_names)
+
+        skipped = 0
+        paths = []
+        for filepath in self._iter_video_files(folder):
+            if self._closing.is_set():
+                return 0, skipped
+            # Check for duplicates (also within this folder, by filename)
+            filename = os.path.basename(filepath)
+            if filepath in existing_paths or filename in seen_names:
+                skipped += 1
+                logger.info('Skipped duplicate: %s', filepath)
+                continue
+
+            seen_names.add(filename)
+            paths.append(filepath)
+
+        return self._import_paths(paths), skipped
+
+    def _import_paths(self, paths: List[str]) -> int:
+        """Probe and insert videos. Runs on the import worker.
+        
+        Args:
+            paths: Video files to add
+            
+        Returns:
+            Number of videos inserted
+        """
+        if len(paths) >= VideoDatabase.BULK_IMPORT_THRESHOLD:
+            with self.db.bulk_import():
+                return self._import_batches(paths)
+        return self._import_batches(paths)
+
+    def _import_batches(self, paths: List[str]) -> int:
+        """Probe and insert paths in batches of VideoDatabase.IMPORT_BATCH_SIZE.
+        
+        Each batch's durations are probed concurrently and its rows go in with one
+        executemany transaction, so the database lock is released between batches.
+        
+        Args:
+            paths: Video files to add
+            
+        Returns:
+            Number of videos inserted
+        """
+        batch_size = VideoDatabase.IMPORT_BATCH_SIZE
+        total = len(paths)
+        added = 0
+        self._import_progress = (0, total)
+        for start in range(0, total, batch_size):
+            if self._closing.is_set():
+                logger.info('Import stopped at %d of %d videos: closing', start, total)
+                break
+            rows = self.db.build_video_rows(paths[start:start + batch_size], self._closing)
+            added += self.db.add_videos_bulk(rows)
+            self._import_progress = (min(start + batch_size, total), total)
+        return added
+
+    def _on_folder_added(self, folder: str, added: int, skipped: int):
+        """Report the result of a folder import. Called from UI thread."""
+        self._total_count = None
+        self.load_videos()
+        message = f'Added {added} videos from the folder'
+        if skipped > 0:
+            message += f' - skipped {skipped} duplicate videos'
+        self._show_status(message)
+        logger.info('Added %d videos from %s (skipped %d duplicates)', added, folder, skipped)
+
+    def _run_in_background(self, job: Callable[[], Any], on_done: Callable[[Any], None],
+                           executor: Optional[ThreadPoolExecutor] = None):
+        """Run job on a worker and call on_done(result) on the UI thread.
+        
+        Args:
+            job: Function to run off the Tk thread
+            on_done: Called with the job's result once it finishes
+            executor: Worker to use (the import worker if None)
+        """
+        future = (executor or self._executor).submit(job)
+        self._pending_jobs += 1
+        future.add_done_callback(lambda f: self._done_queue.put((f, on_done)))
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.BACKGROUND_POLL_MS, self._poll_background)
+
+    def _poll_background(self):
+        """Apply finished background jobs and import progress. Called from UI thread."""
+        progress, self._import_progress = self._import_progress, None
+        if progress is not None:
+            self._show_status('Adding %d/%d videos...' % progress)
+
+        while True:
+            try:
+                future, on_done = self._done_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._pending_jobs -= 1
+            self._finish_job(future, on_done)
+
+        if self._pending_jobs:
+            self._poll_id = self.root.after(self.BACKGROUND_POLL_MS, self._poll_background)
+        else:
+            self._poll_id = None
+
+    def _finish_job(self, future: Future, on_done: Callable[[Any], None]):
+        """Hand a finished job's result to its callback, reporting failures."""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            logger.error('Background job failed: %s', error)
+            messagebox.showerror('Error', f'Operation failed: {error}')
+            return
+        on_done(future.result())
+
+
+    def _iter_video_files(self, folder: str) -> Iterator[str]:
+        """Yield the supported video files under folder in a single directory walk.
+        
+        Extensions are matched case-insensitively, so each file is yielded once.
+        
+        Args:
+            folder: Root folder to scan recursively
+        """
+        formats = self.SUPPORTED_FORMATS
+        # Explicit scandir stack: DirEntry carries the type from the directory
+        # listing, so no extra stat per entry and no per-directory name lists
+        stack = [folder]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError as e:
+                logger.warning('Cannot scan %s: %s', e.filename, e.strerror)
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(formats):
+                        yield entry.path
 
 
     def delete_selected(self):
         """Delete the currently selected video."""
-        if self.preview.selected_video_id:
+        video_id = self.preview.selected_video_id
+        if video_id:
             if messagebox.askyesno('Confirm', 'Delete this video from the database?'):
-                self.db.delete_video(self.preview.selected_video_id)
-                self.load_videos()
+                self.db.delete_video(video_id)
+                self._total_count = None
+                # Only this row went away; drop it instead of reloading every video
+                self.preview.remove_video(video_id)
                 self.editor.cancel()
-                logger.info('Deleted video %d', self.preview.selected_video_id)
+                logger.info('Deleted video %d', video_id)
 
 
     def load_videos(self):
-        """Load all videos from database and update UI."""
-        videos = self.db.get_all_videos()
-        self.preview.load_videos(videos)
-        logger.info('Loaded %d videos', len(videos))
+        """Load all videos from database and update UI.
+        
+        Videos are fetched LOAD_PAGE_SIZE at a time on a worker thread. The first
+        page is shown as soon as it arrives, and each next page is requested before
+        the current one is rendered, so reading and rendering overlap.
+        """
+        self._load_generation += 1
+        self._search_params = None
+        self._request_videos_page(self._load_generation, None)
+
+    def _request_videos_page(self, generation: int, after: Optional[Tuple[str, int]]):
+        """Fetch the page after the given sort key on the read worker.
+        
+        Args:
+            generation: load_videos call the page belongs to
+            after: (added_date, id) of the previous page's last video, or None
+        """
+        self._run_in_background(
+            lambda: self.db.get_videos_page(self.LOAD_PAGE_SIZE, after),
+            lambda page: self._on_videos_page(generation, page, after is None),
+            executor=self._read_executor
+        )
+
+    def _on_videos_page(self, generation: int, videos: List[Dict[str, Any]], first: bool):
+        """Show a page fetched by load_videos. Called from UI thread."""
+        # A newer load or a search has replaced the views since
+        if generation != self._load_generation:
+            return
+
+        more = len(videos) == self.LOAD_PAGE_SIZE
+        if more:
+            last = videos[-1]
+            self._request_videos_page(generation, (last['added_date'], last['id']))
+
+        if first:
+            self.preview.load_videos(videos)
+        else:
+            self.preview.extend_videos(videos)
+
+        if not more:
+            self._total_count = len(self.preview.video_data)
+            logger.info('Loaded %d videos', self._total_count)
 
 
     def _on_video_selected(self, video_id: int, video_data: Dict[str, Any]):
@@ -210,21 +468,40 @@ class VideoManagerApp:
             video_id: Database video ID
             video_data: Video metadata dict
         """
-        # Load into editor
-        full_data = self.db.get_video(video_id)
+        # Load into editor; only query the database if the row lacks a field
+        if self.EDITOR_FIELDS <= video_data.keys():
+            full_data = video_data
+        else:
+            full_data = self.db.get_video(video_id)
         if full_data:
             self.editor.load_video(video_id, full_data)
 
-        # Load into player
+        # Load into player; the existence check can block on network shares
         video_path = video_data.get('path')
-        if video_path and os.path.exists(video_path):
-            self.player.load_video(video_path)
+        if video_path:
+            self._run_in_background(
+                lambda: os.path.exists(video_path),
+                lambda exists: self._on_video_path_checked(video_id, video_path, exists),
+                executor=self._stat_executor
+            )
 
         # Generate timeline (stub - would call FFmpeg for actual thumbnails)
         self.preview.generate_timeline(video_data.get('path', ''))
 
         logger.info('Selected video %d', video_id)
 
+    def _on_video_path_checked(self, video_id: int, video_path: str, exists: bool):
+        """Load a selected video into the player once its file is found. Called from UI thread.
+        
+        Args:
+            video_id: Database video ID
+            video_path: Full path to video file
+            exists: Whether the file exists
+        """
+        # Skip if another video was selected while the check was running
+        if exists and self.preview.selected_video_id == video_id:
+            self.player.load_video(video_path)
+
 
     def _on_video_save(self, video_id: int, updated_fields: Dict[str, Any]):
         """Handle video save from editor.
@@ -235,7 +512,8 @@ class VideoManagerApp:
         """
         success = self.db.update_video(video_id, **updated_fields)
         if success:
-            self.load_videos()
+            # Only this row changed; patch it instead of reloading every video
+            self.preview.update_video(video_id, updated_fields)
             messagebox.askokcancel('Success', f'Video {video_id} updated successfully')
             logger.info('Updated video %d: %s', video_id, updated_fields)
         else:
@@ -269,6 +547,9 @@ class VideoManagerApp:
         Args:
             search_params: Dict with 'query', 'category', 'min_rating', 'search_mode'
         """
+        filtered = (search_params.get('query') or search_params.get('category')
+                    or search_params.get('min_rating', 0) > 0)
+        self._search_params = search_params if filtered else None
         results = self.db.search_videos(
             query=search_params.get('query', ''),
             category=search_params.get('category'),
@@ -282,16 +563,36 @@ class VideoManagerApp:
     def _on_search_results(self, results: List[Dict[str, Any]]):
         """Handle search results.
         
+        The preview is refreshed once SEARCH_RESULTS_DELAY_MS after the
+        latest results, so a burst of searches rebuilds the grid only once.
+        
+        Args:
+            results: List of matching video dictionaries
+        """
+        if self._pending_search_after is not None:
+            self.root.after_cancel(self._pending_search_after)
+        self._pending_search_after = self.root.after(
+            self.SEARCH_RESULTS_DELAY_MS, self._apply_search_results, results
+        )
+
+    def _apply_search_results(self, results: List[Dict[str, Any]]):
+        """Show search results in the preview and the search info label.
+        
         Args:
             results: List of matching video dictionaries
         """
-        all_videos = self.db.get_all_videos()
+        self._pending_search_after = None
+        # Stop a paged load from appending to the search results
+        self._load_generation += 1
+        # Only the total is needed here; it is cached until videos are added or removed
+        if self._total_count is None:
+            self._total_count = self.db.count_videos()
 
         # Update preview with search results
         self.preview.load_videos(results)
 
         # Update search info label
-        self.search.update_info(len(all_videos), len(results))
+        self.search.update_info(self._total_count, len(results))
 
         if not results:
             messagebox.showinfo('No Results', 'No videos found matching your search criteria.')
@@ -323,10 +624,23 @@ Features:
         """Handle window close event."""
         logger.info('Closing VideoManager')
         # Cleanup resources
+        for after_id in (self._poll_id, self._status_clear_id, self._pending_search_after):
+            if after_id is not None:
+                self.root.after_cancel(after_id)
+        self._poll_id = self._status_clear_id = self._pending_search_after = None
+        # A running import stops probing, inserts the rows it has and lets bulk_import
+        # rebuild the indexes before the connection is closed
+        self._closing.set()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._read_executor.shutdown(wait=True, cancel_futures=True)
+        # Existence checks don't touch the database; don't hang on a dead share
+        self._stat_executor.shutdown(wait=False, cancel_futures=True)
+        if hasattr(self, 'search'):
+            self.search.cleanup()
         if hasattr(self, 'preview'):
             self.preview.cleanup()
-        if hasattr(self, 'player'):
-            self.player.cleanup()
+        if getattr(self, '_player', None) is not None:
+            self._player.cleanup()
         if hasattr(self, 'db'):
             self.db.close()
         logger.info('VideoManager closed')